@@ -0,0 +1,61 @@
+"""Test data factories shared by the database, dashboard and tracker tests."""
+
+from datetime import datetime
+from typing import Dict, Optional
+
+from .insights_database import Insight
+from .types import EvaluationResult
+
+# Taken once at import; results built by the factory count as recent
+_NOW = datetime.now().isoformat()
+
+# intermediate_scores and metadata are left as None so that
+# EvaluationResult.__post_init__ gives every result its own empty dicts.
+_BASE = dict(
+    prompt="test prompt",
+    assistant_response="test response",
+    intermediate_scores=None,
+    feedback="test feedback",
+    timestamp=_NOW,
+    code_version="test_version",
+    model_version="test_model",
+    metadata=None,
+)
+
+# Distinct names for tests that store one result per loop index
+SCENARIOS = [f"scenario_{i}" for i in range(16)]
+PERSONAS = [f"persona_{i}" for i in range(16)]
+
+
+def make_result(
+    scenario_name: str = "test_scenario",
+    persona_name: str = "test_persona",
+    scores: Optional[Dict[str, float]] = None,
+    **overrides,
+) -> EvaluationResult:
+    """Build an EvaluationResult from defaults, overriding only what a test needs."""
+    return EvaluationResult(
+        scenario_name=scenario_name,
+        persona_name=persona_name,
+        scores=scores or {"clarity": 4.0, "helpfulness": 4.0},
+        **{**_BASE, **overrides},
+    )
+
+
+def make_insight(
+    insight_type: str = "performance_regression",
+    severity: str = "high",
+    confidence: float = 0.8,
+) -> Insight:
+    """Build a fresh Insight; callers may modify it without affecting others."""
+    return Insight(
+        insight_id=f"test-{insight_type}",
+        insight_type=insight_type,
+        description=f"Test {insight_type} insight",
+        confidence=confidence,
+        severity=severity,
+        category="performance",
+        code_version="0.1.0",
+        timestamp=_NOW,
+        metadata={"test": True, "trend": "declining"},
+    )
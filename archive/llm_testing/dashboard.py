@@ -1,13 +1,20 @@
 """Dashboard and alert system for LLM testing framework."""
 
+import copy
 import json
+import time
 from datetime import datetime, timedelta
-from typing import List, Dict, Any, Optional
+from typing import Callable, List, Dict, Any, Optional, Tuple
 from dataclasses import asdict
 from .database import ResultsDatabase
 from .types import BatchResult, EvaluationReport
 from .notifications import NotificationManager, create_notification_config_from_dict
 
+# How long a getter result may be reused, in seconds. Scenario performance,
+# the key-metrics trend and regression alerts use windows relative to now, so
+# they go stale with the clock even when nothing is written.
+_CACHE_TTL = 5.0
+
 
 class Dashboard:
     """Real-time dashboard for LLM testing metrics and alerts."""
@@ -17,9 +24,33 @@ class Dashboard:
         self.db = db
         self.alert_threshold = alert_threshold
         self.alerts = []
+        # Getter results for the data version in _cache_version; any store
+        # into the database moves the version on and empties the cache.
+        self._cache: Dict[str, Any] = {}
+        self._cache_version: Optional[Tuple[int, int, int, int]] = None
+        self._cache_time = 0.0
+
+    def _cached(self, name: str, compute: Callable[[], Any]) -> Any:
+        """Return compute()'s result, reusing it until the database changes.
+
+        Results also expire after _CACHE_TTL seconds.
+        """
+        version = self.db.data_version()
+        now = time.monotonic()
+        if version != self._cache_version or now - self._cache_time >= _CACHE_TTL:
+            self._cache.clear()
+            self._cache_version = version
+            self._cache_time = now
+        if name not in self._cache:
+            self._cache[name] = compute()
+        # Callers (AlertSystem) annotate the alerts they get back
+        return copy.deepcopy(self._cache[name])
 
     def get_key_metrics(self) -> Dict[str, Any]:
         """Get key metrics for the dashboard."""
+        return self._cached("key_metrics", self._compute_key_metrics)
+
+    def _compute_key_metrics(self) -> Dict[str, Any]:
         recent_results = self.db.get_recent_results(limit=100)
 
         if not recent_results:
@@ -84,26 +115,17 @@ class Dashboard:
 
     def get_scenario_performance(self) -> Dict[str, float]:
         """Get performance breakdown by scenario."""
-        return self.db.get_average_scores_by_scenario(days=7)
+        return self._cached(
+            "scenario_performance",
+            lambda: self.db.get_average_scores_by_scenario(days=7),
+        )
 
     def get_persona_performance(self) -> Dict[str, float]:
         """Get performance breakdown by persona."""
-        recent_results = self.db.get_recent_results(limit=100)
-
-        persona_scores = {}
-        for result in recent_results:
-            persona = result.persona_name
-            score = max(result.scores.values())
-
-            if persona not in persona_scores:
-                persona_scores[persona] = []
-            persona_scores[persona].append(score)
-
-        # Calculate averages
-        return {
-            persona: sum(scores) / len(scores)
-            for persona, scores in persona_scores.items()
-        }
+        return self._cached(
+            "persona_performance",
+            lambda: self.db.get_average_scores_by_persona(limit=100),
+        )
 
     def get_performance_trends(
         self, metric_name: str = "overall_score", days: int = 30
@@ -113,10 +135,13 @@ class Dashboard:
 
     def get_regression_alerts(self) -> List[Dict[str, Any]]:
         """Get regression alerts."""
-        return self.db.get_regression_alerts()
+        return self._cached("regression_alerts", self.db.get_regression_alerts)
 
     def get_insights_summary(self) -> Dict[str, Any]:
         """Get summary of recent insights."""
+        return self._cached("insights_summary", self._compute_insights_summary)
+
+    def _compute_insights_summary(self) -> Dict[str, Any]:
         insight_types = [
             "performance_pattern",
             "user_experience",
@@ -3,332 +3,456 @@
 import sqlite3
 import json
 from datetime import datetime
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
 from dataclasses import asdict
 from .types import EvaluationResult, BatchResult, ScenarioResult
 
 
+# Applied to throwaway databases (tests, scratch runs), trading durability for
+# speed: no journal file, no fsync, no lock handoff between commits.
+_FAST_PRAGMAS = (
+    "journal_mode=MEMORY",
+    "synchronous=OFF",
+    "temp_store=MEMORY",
+    "locking_mode=EXCLUSIVE",
+    "cache_size=-20000",
+)
+
+# Scores read by SQL aggregates get their own columns next to the JSON
+_SCORE_KEYS = ("overall", "clarity", "helpfulness")
+_SQL_RESULT_COLUMNS = "PRAGMA table_info(evaluation_results)"
+
+_SQL_INSERT_RESULT = """
+    INSERT INTO evaluation_results (
+        scenario_name, persona_name, prompt, assistant_response,
+        scores, intermediate_scores, feedback, timestamp,
+        code_version, model_version, metadata,
+        score_overall, score_clarity, score_helpfulness
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+_SQL_INSERT_BATCH = """
+    INSERT INTO batch_results (
+        batch_id, scenarios, results, summary, insights, performance_alerts
+    ) VALUES (?, ?, ?, ?, ?, ?)
+"""
+_SQL_INSERT_INSIGHT = """
+    INSERT INTO insights (
+        insight_type, description, confidence, evidence,
+        recommendations, timestamp, code_version, model_version, linked_issues
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+# created_at follows an explicit timestamp, so backdated metrics fall into
+# the right trend and regression windows
+_SQL_INSERT_METRIC = """
+    INSERT INTO performance_trends (
+        metric_name, value, timestamp, code_version, model_version, created_at
+    ) VALUES (?, ?, ?, ?, ?, COALESCE(datetime(?), CURRENT_TIMESTAMP))
+"""
+_SQL_RECENT_RESULTS = """
+    SELECT * FROM evaluation_results
+    ORDER BY created_at DESC
+    LIMIT ?
+"""
+_SQL_TRENDS = """
+    SELECT value, timestamp, code_version, model_version
+    FROM performance_trends
+    WHERE metric_name = ?
+    AND created_at >= datetime('now', ?)
+    ORDER BY created_at ASC
+"""
+_SQL_INSIGHTS_BY_TYPE = """
+    SELECT * FROM insights
+    WHERE insight_type = ?
+    ORDER BY created_at DESC
+    LIMIT ?
+"""
+_SQL_AVG_BY_SCENARIO = """
+    SELECT scenario_name, AVG(score_overall) as avg_score
+    FROM evaluation_results
+    WHERE created_at >= datetime('now', ?)
+    GROUP BY scenario_name
+    ORDER BY avg_score DESC
+"""
+# Each result counts with its best score, over the latest ``limit`` results
+_SQL_AVG_BY_PERSONA = """
+    SELECT persona_name, AVG(best_score)
+    FROM (
+        SELECT persona_name,
+               (SELECT MAX(value) FROM json_each(scores)) AS best_score
+        FROM evaluation_results
+        ORDER BY created_at DESC
+        LIMIT ?
+    )
+    GROUP BY persona_name
+"""
+_SQL_RECENT_METRICS = """
+    SELECT metric_name, AVG(value) as recent_avg
+    FROM performance_trends
+    WHERE created_at >= datetime('now', '-7 days')
+    GROUP BY metric_name
+"""
+_SQL_HISTORICAL_METRIC = """
+    SELECT AVG(value) as historical_avg
+    FROM performance_trends
+    WHERE metric_name = ?
+    AND created_at < datetime('now', '-7 days')
+    AND created_at >= datetime('now', '-30 days')
+"""
+# Highest row id per table; rows are only ever appended, so this changes
+# whenever anything is stored
+_SQL_DATA_VERSION = """
+    SELECT
+        (SELECT COALESCE(MAX(id), 0) FROM evaluation_results),
+        (SELECT COALESCE(MAX(id), 0) FROM insights),
+        (SELECT COALESCE(MAX(id), 0) FROM performance_trends)
+"""
+
+
+def _days_ago(days: int) -> str:
+    """Format a datetime() modifier for N days before now."""
+    return f"-{int(days)} days"
+
+
+# Same output as json.dumps with default arguments, minus its per-call
+# argument handling; rows are packed once per stored result.
+_encode = json.JSONEncoder().encode
+
+
+def _result_row(result: EvaluationResult) -> tuple:
+    """Return an evaluation result as an ``evaluation_results`` insert row."""
+    return (
+        result.scenario_name,
+        result.persona_name,
+        result.prompt,
+        result.assistant_response,
+        _encode(result.scores),
+        _encode(result.intermediate_scores),
+        result.feedback,
+        result.timestamp,
+        result.code_version,
+        result.model_version,
+        _encode(result.metadata),
+        *map(result.scores.get, _SCORE_KEYS),
+    )
+
+
 class ResultsDatabase:
     """SQLite database for storing test results and insights."""
 
-    def __init__(self, db_path: str = "llm_testing/results.db"):
-        """Initialize the database."""
+    def __init__(self, db_path: str = "llm_testing/results.db", fast: bool = False):
+        """Initialize the database.
+
+        ``fast`` turns off journaling and fsync for databases that need not
+        survive a crash; it is implied for ":memory:".
+        """
         self.db_path = db_path
+        self.fast = fast or db_path == ":memory:"
+        # One long-lived autocommit connection, so every statement commits on
+        # its own and ":memory:" databases survive between calls.
+        self.conn = sqlite3.connect(
+            db_path,
+            check_same_thread=False,
+            isolation_level=None,
+            cached_statements=256,
+        )
         self._create_tables()
 
+    def close(self):
+        """Close the database connection."""
+        self.conn.close()
+
+    def __enter__(self) -> "ResultsDatabase":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
     def _create_tables(self):
         """Create database tables if they don't exist."""
-        with sqlite3.connect(self.db_path) as conn:
-            conn.execute(
-                """
-                CREATE TABLE IF NOT EXISTS evaluation_results (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    scenario_name TEXT NOT NULL,
-                    persona_name TEXT NOT NULL,
-                    prompt TEXT NOT NULL,
-                    assistant_response TEXT NOT NULL,
-                    scores TEXT NOT NULL,  -- JSON
-                    intermediate_scores TEXT,  -- JSON
-                    feedback TEXT NOT NULL,
-                    timestamp TEXT NOT NULL,
-                    code_version TEXT NOT NULL,
-                    model_version TEXT NOT NULL,
-                    metadata TEXT,  -- JSON
-                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-                )
+        conn = self.conn
+        if self.fast:
+            for pragma in _FAST_PRAGMAS:
+                conn.execute(f"PRAGMA {pragma}")
+        else:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute(
             """
+            CREATE TABLE IF NOT EXISTS evaluation_results (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                scenario_name TEXT NOT NULL,
+                persona_name TEXT NOT NULL,
+                prompt TEXT NOT NULL,
+                assistant_response TEXT NOT NULL,
+                scores TEXT NOT NULL,  -- JSON
+                intermediate_scores TEXT,  -- JSON
+                feedback TEXT NOT NULL,
+                timestamp TEXT NOT NULL,
+                code_version TEXT NOT NULL,
+                model_version TEXT NOT NULL,
+                metadata TEXT,  -- JSON
+                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                score_overall REAL,
+                score_clarity REAL,
+                score_helpfulness REAL
             )
+        """
+        )
 
-            conn.execute(
-                """
-                CREATE TABLE IF NOT EXISTS batch_results (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    batch_id TEXT UNIQUE NOT NULL,
-                    scenarios TEXT NOT NULL,  -- JSON
-                    results TEXT NOT NULL,  -- JSON
-                    summary TEXT NOT NULL,  -- JSON
-                    insights TEXT,  -- JSON
-                    performance_alerts TEXT,  -- JSON
-                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-                )
+        conn.execute(
             """
+            CREATE TABLE IF NOT EXISTS batch_results (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                batch_id TEXT UNIQUE NOT NULL,
+                scenarios TEXT NOT NULL,  -- JSON
+                results TEXT NOT NULL,  -- JSON
+                summary TEXT NOT NULL,  -- JSON
+                insights TEXT,  -- JSON
+                performance_alerts TEXT,  -- JSON
+                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
             )
+        """
+        )
 
-            conn.execute(
-                """
-                CREATE TABLE IF NOT EXISTS insights (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    insight_type TEXT NOT NULL,
-                    description TEXT NOT NULL,
-                    confidence REAL NOT NULL,
-                    evidence TEXT,  -- JSON
-                    recommendations TEXT,  -- JSON
-                    timestamp TEXT NOT NULL,
-                    code_version TEXT NOT NULL,
-                    model_version TEXT NOT NULL,
-                    linked_issues TEXT,  -- JSON
-                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-                )
+        conn.execute(
             """
+            CREATE TABLE IF NOT EXISTS insights (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                insight_type TEXT NOT NULL,
+                description TEXT NOT NULL,
+                confidence REAL NOT NULL,
+                evidence TEXT,  -- JSON
+                recommendations TEXT,  -- JSON
+                timestamp TEXT NOT NULL,
+                code_version TEXT NOT NULL,
+                model_version TEXT NOT NULL,
+                linked_issues TEXT,  -- JSON
+                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
             )
+        """
+        )
 
-            conn.execute(
-                """
-                CREATE TABLE IF NOT EXISTS performance_trends (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    metric_name TEXT NOT NULL,
-                    value REAL NOT NULL,
-                    timestamp TEXT NOT NULL,
-                    code_version TEXT NOT NULL,
-                    model_version TEXT NOT NULL,
-                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-                )
+        conn.execute(
             """
+            CREATE TABLE IF NOT EXISTS performance_trends (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                metric_name TEXT NOT NULL,
+                value REAL NOT NULL,
+                timestamp TEXT NOT NULL,
+                code_version TEXT NOT NULL,
+                model_version TEXT NOT NULL,
+                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
             )
+        """
+        )
 
-    def store_evaluation_result(self, result: EvaluationResult):
-        """Store a single evaluation result."""
-        with sqlite3.connect(self.db_path) as conn:
+        # Databases created before the score_* columns existed get them added
+        # and filled in from the scores JSON
+        columns = {row[1] for row in conn.execute(_SQL_RESULT_COLUMNS)}
+        missing = [k for k in _SCORE_KEYS if f"score_{k}" not in columns]
+        for key in missing:
+            conn.execute(f"ALTER TABLE evaluation_results ADD COLUMN score_{key} REAL")
             conn.execute(
-                """
-                INSERT INTO evaluation_results (
-                    scenario_name, persona_name, prompt, assistant_response,
-                    scores, intermediate_scores, feedback, timestamp,
-                    code_version, model_version, metadata
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """,
-                (
-                    result.scenario_name,
-                    result.persona_name,
-                    result.prompt,
-                    result.assistant_response,
-                    json.dumps(result.scores),
-                    json.dumps(result.intermediate_scores),
-                    result.feedback,
-                    result.timestamp,
-                    result.code_version,
-                    result.model_version,
-                    json.dumps(result.metadata),
-                ),
+                f"UPDATE evaluation_results "
+                f"SET score_{key} = json_extract(scores, '$.{key}')"
             )
+        conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_results_scenario "
+            "ON evaluation_results(scenario_name, created_at, score_overall)"
+        )
+
+    def store_evaluation_result(self, result: EvaluationResult):
+        """Store a single evaluation result."""
+        self.store_evaluation_results_bulk([result])
+
+    def store_evaluation_results_bulk(self, results: List[EvaluationResult]):
+        """Store several evaluation results in one transaction."""
+        rows = [_result_row(r) for r in results]
+        conn = self.conn
+        # A savepoint rather than BEGIN, so this also nests inside a caller's
+        # open transaction.
+        conn.execute("SAVEPOINT bulk_results")
+        try:
+            conn.executemany(_SQL_INSERT_RESULT, rows)
+        except sqlite3.Error:
+            conn.execute("ROLLBACK TO bulk_results")
+            conn.execute("RELEASE bulk_results")
+            raise
+        conn.execute("RELEASE bulk_results")
 
     def store_batch_result(self, batch_result: BatchResult):
         """Store a batch result."""
-        with sqlite3.connect(self.db_path) as conn:
-            conn.execute(
-                """
-                INSERT INTO batch_results (
-                    batch_id, scenarios, results, summary, insights, performance_alerts
-                ) VALUES (?, ?, ?, ?, ?, ?)
-            """,
-                (
-                    batch_result.batch_id,
-                    json.dumps([asdict(s) for s in batch_result.scenarios]),
-                    json.dumps([asdict(r) for r in batch_result.results]),
-                    json.dumps(batch_result.summary),
-                    json.dumps(batch_result.insights),
-                    json.dumps(batch_result.performance_alerts),
-                ),
-            )
+        self.conn.execute(
+            _SQL_INSERT_BATCH,
+            (
+                batch_result.batch_id,
+                json.dumps([asdict(s) for s in batch_result.scenarios]),
+                json.dumps([asdict(r) for r in batch_result.results]),
+                json.dumps(batch_result.summary),
+                json.dumps(batch_result.insights),
+                json.dumps(batch_result.performance_alerts),
+            ),
+        )
 
     def store_insight(self, insight: Dict[str, Any]):
         """Store an insight."""
-        with sqlite3.connect(self.db_path) as conn:
-            conn.execute(
-                """
-                INSERT INTO insights (
-                    insight_type, description, confidence, evidence,
-                    recommendations, timestamp, code_version, model_version, linked_issues
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """,
-                (
-                    insight["insight_type"],
-                    insight["description"],
-                    insight["confidence"],
-                    json.dumps(insight.get("evidence", [])),
-                    json.dumps(insight.get("recommendations", [])),
-                    insight["timestamp"],
-                    insight["code_version"],
-                    insight["model_version"],
-                    json.dumps(insight.get("linked_issues", [])),
-                ),
-            )
+        self.conn.execute(
+            _SQL_INSERT_INSIGHT,
+            (
+                insight["insight_type"],
+                insight["description"],
+                insight["confidence"],
+                json.dumps(insight.get("evidence", [])),
+                json.dumps(insight.get("recommendations", [])),
+                insight["timestamp"],
+                insight["code_version"],
+                insight["model_version"],
+                json.dumps(insight.get("linked_issues", [])),
+            ),
+        )
 
     def store_performance_metric(
-        self, metric_name: str, value: float, code_version: str, model_version: str
+        self,
+        metric_name: str,
+        value: float,
+        code_version: str,
+        model_version: str,
+        timestamp: Optional[str] = None,
     ):
-        """Store a performance metric for trend analysis."""
-        with sqlite3.connect(self.db_path) as conn:
-            conn.execute(
-                """
-                INSERT INTO performance_trends (
-                    metric_name, value, timestamp, code_version, model_version
-                ) VALUES (?, ?, ?, ?, ?)
-            """,
-                (
-                    metric_name,
-                    value,
-                    datetime.now().isoformat(),
-                    code_version,
-                    model_version,
-                ),
-            )
+        """Store a performance metric for trend analysis.
+
+        ``timestamp`` (ISO 8601) records the metric as of that time instead of
+        now; it is compared against UTC when selecting trend windows.
+        """
+        self.conn.execute(
+            _SQL_INSERT_METRIC,
+            (
+                metric_name,
+                value,
+                timestamp or datetime.now().isoformat(),
+                code_version,
+                model_version,
+                timestamp,
+            ),
+        )
+
+    def data_version(self) -> Tuple[int, int, int, int]:
+        """Key that changes whenever a result, insight or metric is stored.
+
+        The highest row ids catch writes from any connection. This
+        connection's change count also catches its own writes when a
+        rolled-back insert frees an id that is then reused.
+        """
+        return (
+            *self.conn.execute(_SQL_DATA_VERSION).fetchone(),
+            self.conn.total_changes,
+        )
 
     def get_recent_results(self, limit: int = 100) -> List[EvaluationResult]:
         """Get recent evaluation results."""
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.execute(
-                """
-                SELECT * FROM evaluation_results 
-                ORDER BY created_at DESC 
-                LIMIT ?
-            """,
-                (limit,),
-            )
+        cursor = self.conn.execute(_SQL_RECENT_RESULTS, (limit,))
 
-            results = []
-            for row in cursor.fetchall():
-                result = EvaluationResult(
-                    scenario_name=row[1],
-                    persona_name=row[2],
-                    prompt=row[3],
-                    assistant_response=row[4],
-                    scores=json.loads(row[5]),
-                    intermediate_scores=json.loads(row[6]) if row[6] else {},
-                    feedback=row[7],
-                    timestamp=row[8],
-                    code_version=row[9],
-                    model_version=row[10],
-                    metadata=json.loads(row[11]) if row[11] else {},
-                )
-                results.append(result)
+        results = []
+        for row in cursor.fetchall():
+            result = EvaluationResult(
+                scenario_name=row[1],
+                persona_name=row[2],
+                prompt=row[3],
+                assistant_response=row[4],
+                scores=json.loads(row[5]),
+                intermediate_scores=json.loads(row[6]) if row[6] else {},
+                feedback=row[7],
+                timestamp=row[8],
+                code_version=row[9],
+                model_version=row[10],
+                metadata=json.loads(row[11]) if row[11] else {},
+            )
+            results.append(result)
 
-            return results
+        return results
 
     def get_performance_trends(
         self, metric_name: str, days: int = 30
     ) -> List[Dict[str, Any]]:
         """Get performance trends for a specific metric."""
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.execute(
-                """
-                SELECT value, timestamp, code_version, model_version 
-                FROM performance_trends 
-                WHERE metric_name = ? 
-                AND created_at >= datetime('now', '-{} days')
-                ORDER BY created_at ASC
-            """.format(
-                    days
-                ),
-                (metric_name,),
-            )
+        cursor = self.conn.execute(_SQL_TRENDS, (metric_name, _days_ago(days)))
 
-            trends = []
-            for row in cursor.fetchall():
-                trends.append(
-                    {
-                        "value": row[0],
-                        "timestamp": row[1],
-                        "code_version": row[2],
-                        "model_version": row[3],
-                    }
-                )
+        trends = []
+        for row in cursor.fetchall():
+            trends.append(
+                {
+                    "value": row[0],
+                    "timestamp": row[1],
+                    "code_version": row[2],
+                    "model_version": row[3],
+                }
+            )
 
-            return trends
+        return trends
 
     def get_insights_by_type(
         self, insight_type: str, limit: int = 50
     ) -> List[Dict[str, Any]]:
         """Get insights by type."""
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.execute(
-                """
-                SELECT * FROM insights 
-                WHERE insight_type = ? 
-                ORDER BY created_at DESC 
-                LIMIT ?
-            """,
-                (insight_type, limit),
-            )
+        cursor = self.conn.execute(_SQL_INSIGHTS_BY_TYPE, (insight_type, limit))
 
-            insights = []
-            for row in cursor.fetchall():
-                insights.append(
-                    {
-                        "insight_type": row[1],
-                        "description": row[2],
-                        "confidence": row[3],
-                        "evidence": json.loads(row[4]) if row[4] else [],
-                        "recommendations": json.loads(row[5]) if row[5] else [],
-                        "timestamp": row[6],
-                        "code_version": row[7],
-                        "model_version": row[8],
-                        "linked_issues": json.loads(row[9]) if row[9] else [],
-                    }
-                )
+        insights = []
+        for row in cursor.fetchall():
+            insights.append(
+                {
+                    "insight_type": row[1],
+                    "description": row[2],
+                    "confidence": row[3],
+                    "evidence": json.loads(row[4]) if row[4] else [],
+                    "recommendations": json.loads(row[5]) if row[5] else [],
+                    "timestamp": row[6],
+                    "code_version": row[7],
+                    "model_version": row[8],
+                    "linked_issues": json.loads(row[9]) if row[9] else [],
+                }
+            )
 
-            return insights
+        return insights
 
     def get_average_scores_by_scenario(self, days: int = 7) -> Dict[str, float]:
         """Get average scores by scenario for recent results."""
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.execute(
-                """
-                SELECT scenario_name, AVG(CAST(json_extract(scores, '$.overall') AS REAL)) as avg_score
-                FROM evaluation_results 
-                WHERE created_at >= datetime('now', '-{} days')
-                GROUP BY scenario_name
-                ORDER BY avg_score DESC
-            """.format(
-                    days
-                )
-            )
+        cursor = self.conn.execute(_SQL_AVG_BY_SCENARIO, (_days_ago(days),))
+
+        return {row[0]: row[1] for row in cursor.fetchall()}
 
-            return {row[0]: row[1] for row in cursor.fetchall()}
+    def get_average_scores_by_persona(self, limit: int = 100) -> Dict[str, float]:
+        """Get average best score by persona over the most recent results."""
+        cursor = self.conn.execute(_SQL_AVG_BY_PERSONA, (limit,))
+
+        return dict(cursor.fetchall())
 
     def get_regression_alerts(self, threshold: float = 0.1) -> List[Dict[str, Any]]:
         """Detect performance regressions."""
         # Get recent performance trends and compare with historical data
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.execute(
-                """
-                SELECT metric_name, AVG(value) as recent_avg
-                FROM performance_trends 
-                WHERE created_at >= datetime('now', '-7 days')
-                GROUP BY metric_name
-            """
-            )
+        conn = self.conn
+        cursor = conn.execute(_SQL_RECENT_METRICS)
+
+        recent_metrics = {row[0]: row[1] for row in cursor.fetchall()}
 
-            recent_metrics = {row[0]: row[1] for row in cursor.fetchall()}
-
-            alerts = []
-            for metric_name, recent_avg in recent_metrics.items():
-                # Compare with historical average
-                cursor = conn.execute(
-                    """
-                    SELECT AVG(value) as historical_avg
-                    FROM performance_trends 
-                    WHERE metric_name = ? 
-                    AND created_at < datetime('now', '-7 days')
-                    AND created_at >= datetime('now', '-30 days')
-                """,
-                    (metric_name,),
+        alerts = []
+        for metric_name, recent_avg in recent_metrics.items():
+            # Compare with historical average
+            cursor = conn.execute(_SQL_HISTORICAL_METRIC, (metric_name,))
+
+            historical_avg = cursor.fetchone()[0]
+            if (
+                historical_avg
+                and (historical_avg - recent_avg) / historical_avg > threshold
+            ):
+                alerts.append(
+                    {
+                        "metric_name": metric_name,
+                        "recent_avg": recent_avg,
+                        "historical_avg": historical_avg,
+                        "regression_percentage": (historical_avg - recent_avg)
+                        / historical_avg
+                        * 100,
+                    }
                 )
 
-                historical_avg = cursor.fetchone()[0]
-                if (
-                    historical_avg
-                    and (historical_avg - recent_avg) / historical_avg > threshold
-                ):
-                    alerts.append(
-                        {
-                            "metric_name": metric_name,
-                            "recent_avg": recent_avg,
-                            "historical_avg": historical_avg,
-                            "regression_percentage": (historical_avg - recent_avg)
-                            / historical_avg
-                            * 100,
-                        }
-                    )
-
-            return alerts
+        return alerts
@@ -1,5 +1,6 @@
 """Evaluation loop for LLM-to-LLM testing framework."""
 
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Dict, Any, Optional
 from datetime import datetime
 from .config import TestingConfig
@@ -9,6 +10,9 @@ from .types import EvaluationResult, ScenarioResult, BatchResult, EvaluationRepo
 from .database import ResultsDatabase
 from .dashboard import Dashboard, AlertSystem
 
+# Upper bound on scenarios evaluated at once by run_batch
+_MAX_WORKERS = 8
+
 
 class EvaluationLoop:
     """Orchestrate the testing process and track results over time."""
@@ -24,8 +28,24 @@ class EvaluationLoop:
         self.dashboard = Dashboard(self.results_db, config.alert_threshold)
         self.alert_system = AlertSystem(self.dashboard)
 
+    def close(self):
+        """Close the results database once the loop is done with it."""
+        self.results_db.close()
+
+    def __enter__(self) -> "EvaluationLoop":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
     def run_scenario(self, scenario: Scenario) -> ScenarioResult:
         """Execute a single scenario with the assistant."""
+        scenario_result = self._evaluate_scenario(scenario)
+        self._store_scenario_results([scenario_result])
+        return scenario_result
+
+    def _evaluate_scenario(self, scenario: Scenario) -> ScenarioResult:
+        """Run and score a scenario without touching the database."""
         results = []
 
         for prompt in scenario.test_prompts:
@@ -47,17 +67,6 @@ class EvaluationLoop:
             success_rate = 0.0
             average_score = 0.0
 
-        # Store results in database
-        for result in results:
-            self.results_db.store_evaluation_result(result)
-
-        # Store performance metrics
-        if results:
-            overall_score = sum(scores) / len(scores)
-            self.results_db.store_performance_metric(
-                "overall_score", overall_score, "unknown", "unknown"
-            )
-
         return ScenarioResult(
             scenario=scenario,
             results=results,
@@ -76,14 +85,35 @@ class EvaluationLoop:
             ),
         )
 
+    def _store_scenario_results(self, scenario_results: List[ScenarioResult]):
+        """Store the results and overall score of each scenario."""
+        self.results_db.store_evaluation_results_bulk(
+            [r for sr in scenario_results for r in sr.results]
+        )
+        for scenario_result in scenario_results:
+            if scenario_result.results:
+                self.results_db.store_performance_metric(
+                    "overall_score",
+                    scenario_result.average_score,
+                    "unknown",
+                    "unknown",
+                )
+
     def run_batch(self, scenarios: List[Scenario]) -> BatchResult:
         """Run multiple scenarios and aggregate results."""
         all_results = []
         scenario_results = []
 
-        for scenario in scenarios:
-            scenario_result = self.run_scenario(scenario)
-            scenario_results.append(scenario_result)
+        # Scenarios are independent and spend their time waiting on the
+        # assistant and scorer, so evaluate them concurrently; the database is
+        # only written from this thread once they have all finished.
+        if scenarios:
+            workers = min(_MAX_WORKERS, len(scenarios))
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                scenario_results = list(pool.map(self._evaluate_scenario, scenarios))
+            self._store_scenario_results(scenario_results)
+
+        for scenario_result in scenario_results:
             all_results.extend(scenario_result.results)
 
         # Store batch result in database
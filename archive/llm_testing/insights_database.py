@@ -1,13 +1,115 @@
 """Insights database for storing and retrieving testing insights."""
 
+import copy
+import functools
 import sqlite3
 import json
-from datetime import datetime
-from typing import List, Dict, Any, Optional
-from dataclasses import asdict, dataclass
+import threading
+import time
+from typing import List, Dict, Any, Optional, Tuple
+from dataclasses import asdict, dataclass, field
 
+try:
+    import orjson  # type: ignore
+except ImportError:  # pragma: no cover - optional
+    orjson = None
 
-@dataclass
+
+_SQL_INSERT = """
+    INSERT OR REPLACE INTO insights 
+    (insight_id, insight_type, description, confidence, severity, 
+     category, code_version, timestamp, metadata, linked_issues, linked_insights)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+_SQL_GET = "SELECT * FROM insights WHERE insight_id = ?"
+_SQL_GET_BY_TYPE = """
+    SELECT * FROM insights 
+    WHERE insight_type = ? 
+    ORDER BY timestamp DESC 
+    LIMIT ?
+"""
+_SQL_GET_BY_CATEGORY = """
+    SELECT * FROM insights 
+    WHERE category = ? 
+    ORDER BY timestamp DESC 
+    LIMIT ?
+"""
+_SQL_GET_BY_VERSION = """
+    SELECT * FROM insights 
+    WHERE code_version = ? 
+    ORDER BY timestamp DESC 
+    LIMIT ?
+"""
+# Counts for callers that only need how many rows match; served by the same
+# indexes as the getters above without reading or decoding the rows
+_SQL_COUNT_BY_TYPE = "SELECT COUNT(*) FROM insights WHERE insight_type = ?"
+_SQL_COUNT_BY_CATEGORY = "SELECT COUNT(*) FROM insights WHERE category = ?"
+_SQL_COUNT_BY_VERSION = "SELECT COUNT(*) FROM insights WHERE code_version = ?"
+_SQL_GET_RECENT = """
+    SELECT * FROM insights 
+    WHERE timestamp >= datetime('now', ?)
+    ORDER BY timestamp DESC 
+    LIMIT ?
+"""
+_SQL_GET_HIGH_CONFIDENCE = """
+    SELECT * FROM insights 
+    WHERE confidence >= ? 
+    ORDER BY confidence DESC, timestamp DESC 
+    LIMIT ?
+"""
+# Every summary figure in one pass; rows are tagged by what they count
+_SQL_SUMMARY = """
+    SELECT 'type', insight_type, COUNT(*), NULL FROM insights GROUP BY insight_type
+    UNION ALL
+    SELECT 'severity', severity, COUNT(*), NULL FROM insights GROUP BY severity
+    UNION ALL
+    SELECT 'total', NULL, COUNT(*), AVG(confidence) FROM insights
+    UNION ALL
+    SELECT 'recent', NULL, COUNT(*), NULL FROM insights
+    WHERE timestamp >= datetime('now', ?)
+"""
+# How long get_insights_summary may serve a cached result, in seconds
+_SUMMARY_TTL = 5.0
+# Refresh planner statistics after this many inserted rows
+_OPTIMIZE_EVERY = 1000
+
+_SQL_LEGACY_INDEXES = """
+    SELECT COUNT(*) FROM sqlite_master WHERE type = 'index'
+    AND name IN ('idx_insight_type', 'idx_category', 'idx_code_version')
+"""
+_SQL_HAS_STATS = "SELECT 1 FROM sqlite_master WHERE name = 'sqlite_stat1'"
+
+# Moves whenever another connection commits to the database file
+_SQL_DATA_VERSION = "PRAGMA data_version"
+
+_SQL_DELETE = "DELETE FROM insights WHERE insight_id = ?"
+_SQL_CLEAR_OLD = "DELETE FROM insights WHERE timestamp < datetime('now', ?)"
+
+
+# Fallback when orjson is missing, producing the same compact UTF-8 text it does
+_encode = json.JSONEncoder(separators=(",", ":"), ensure_ascii=False).encode
+# Most insights carry no links and many no metadata; skip the encoder for those
+_EMPTY_JSON = {list: "[]", dict: "{}"}
+
+
+def _dumps(obj: Any) -> str:
+    if not obj and type(obj) in _EMPTY_JSON:
+        return _EMPTY_JSON[type(obj)]
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode()
+    return _encode(obj)
+
+
+def _loads(text: str) -> Any:
+    return orjson.loads(text) if orjson is not None else json.loads(text)
+
+
+def _days_ago(days: int) -> str:
+    """Format a datetime() modifier for N days before now."""
+    return f"-{int(days)} days"
+
+
+@dataclass(slots=True)
 class Insight:
     """Represents a testing insight with metadata."""
 
@@ -19,31 +121,109 @@ class Insight:
     category: str  # e.g., "persona", "scenario", "system"
     code_version: str
     timestamp: str
-    metadata: Dict[str, Any]
-    linked_issues: List[str] = None
-    linked_insights: List[str] = None
+    metadata: Dict[str, Any] = field(default_factory=dict)
+    linked_issues: List[str] = field(default_factory=list)
+    linked_insights: List[str] = field(default_factory=list)
 
-    def __post_init__(self):
-        """Set default values after initialization."""
-        if self.linked_issues is None:
-            self.linked_issues = []
-        if self.linked_insights is None:
-            self.linked_insights = []
-        if self.metadata is None:
-            self.metadata = {}
+    def to_row(self) -> tuple:
+        """Return the insight as a row in ``insights`` column order."""
+        return (
+            self.insight_id,
+            self.insight_type,
+            self.description,
+            self.confidence,
+            self.severity,
+            self.category,
+            self.code_version,
+            self.timestamp,
+            _dumps(self.metadata),
+            _dumps(self.linked_issues),
+            _dumps(self.linked_insights),
+        )
+
+
+def _row_to_insight(row) -> Insight:
+    """Build an Insight from a row of ``SELECT * FROM insights``."""
+    return Insight(
+        *row[:8], _loads(row[8]), _loads(row[9]), _loads(row[10])
+    )
 
 
 class InsightsDatabase:
     """SQLite database for storing and retrieving testing insights."""
 
-    def __init__(self, db_path: str = "llm_testing/insights.db"):
-        """Initialize the insights database."""
+    def __init__(self, db_path: str = "llm_testing/insights.db", fast: bool = False):
+        """Initialize the insights database.
+
+        ``fast`` turns off journaling and fsync for databases that need not
+        survive a crash; it is implied for ":memory:".
+        """
         self.db_path = db_path
+        self.fast = fast or db_path == ":memory:"
+        # One long-lived autocommit connection shared by every method; the lock
+        # serialises access since it is used across threads.
+        self._conn = sqlite3.connect(
+            db_path,
+            check_same_thread=False,
+            isolation_level=None,
+            cached_statements=256,
+            # e.g. "file:name?mode=memory&cache=shared"
+            uri=db_path.startswith("file:"),
+        )
+        self._lock = threading.Lock()
+        # Read results keyed on data_version(), so a write from any connection
+        # makes earlier results unreachable.
+        self._cached_query = functools.lru_cache(maxsize=256)(self._query_tuple)
+        self._summary: Optional[Tuple[Tuple[int, int], float, Dict[str, Any]]] = None
+        self._inserts_since_optimize = 0
         self._create_tables()
 
+    def data_version(self) -> Tuple[int, int]:
+        """Key that changes whenever the insights may have changed.
+
+        PRAGMA data_version moves when another connection or process commits;
+        this connection's change count moves with its own writes.
+        """
+        with self._lock:
+            return (
+                self._conn.execute(_SQL_DATA_VERSION).fetchone()[0],
+                self._conn.total_changes,
+            )
+
+    def invalidate_cache(self):
+        """Drop cached query results to free their memory."""
+        self._cached_query.cache_clear()
+        self._summary = None
+
+    def close(self):
+        """Refresh planner statistics and close the database connection."""
+        with self._lock:
+            try:
+                self._conn.execute("PRAGMA optimize")
+            except sqlite3.Error:
+                pass  # already closed
+            self._conn.close()
+
+    def __enter__(self) -> "InsightsDatabase":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
     def _create_tables(self):
         """Create the insights table if it doesn't exist."""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._lock:
+            conn = self._conn
+            if self.fast:
+                conn.execute("PRAGMA journal_mode=MEMORY")
+                conn.execute("PRAGMA synchronous=OFF")
+                conn.execute("PRAGMA locking_mode=EXCLUSIVE")
+            else:
+                conn.execute("PRAGMA journal_mode=WAL")
+                conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute("PRAGMA cache_size=-65536")
+            conn.execute("PRAGMA temp_store=MEMORY")
+            conn.execute("PRAGMA mmap_size=268435456")
             conn.execute(
                 """
                 CREATE TABLE IF NOT EXISTS insights (
@@ -62,15 +242,23 @@ class InsightsDatabase:
             """
             )
 
-            # Create indexes for efficient querying
+            # Create indexes for efficient querying. The filtered getters order
+            # by timestamp, so their indexes carry it and the scan stops at LIMIT.
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_type_ts "
+                "ON insights(insight_type, timestamp DESC)"
+            )
             conn.execute(
-                "CREATE INDEX IF NOT EXISTS idx_insight_type ON insights(insight_type)"
+                "CREATE INDEX IF NOT EXISTS idx_category_ts "
+                "ON insights(category, timestamp DESC)"
             )
             conn.execute(
-                "CREATE INDEX IF NOT EXISTS idx_category ON insights(category)"
+                "CREATE INDEX IF NOT EXISTS idx_version_ts "
+                "ON insights(code_version, timestamp DESC)"
             )
             conn.execute(
-                "CREATE INDEX IF NOT EXISTS idx_code_version ON insights(code_version)"
+                "CREATE INDEX IF NOT EXISTS idx_confidence_ts "
+                "ON insights(confidence DESC, timestamp DESC)"
             )
             conn.execute(
                 "CREATE INDEX IF NOT EXISTS idx_timestamp ON insights(timestamp)"
@@ -78,64 +266,75 @@ class InsightsDatabase:
             conn.execute(
                 "CREATE INDEX IF NOT EXISTS idx_severity ON insights(severity)"
             )
+            # Superseded by the composite indexes above
+            legacy = conn.execute(_SQL_LEGACY_INDEXES).fetchone()[0]
+            conn.execute("DROP INDEX IF EXISTS idx_insight_type")
+            conn.execute("DROP INDEX IF EXISTS idx_category")
+            conn.execute("DROP INDEX IF EXISTS idx_code_version")
+            # Gather planner statistics once, when the composite indexes take
+            # over from the old ones or the db was never analyzed; after that
+            # PRAGMA optimize keeps them current without a full rescan
+            if legacy or not conn.execute(_SQL_HAS_STATS).fetchone():
+                conn.execute("ANALYZE")
 
     def store_insight(self, insight: Insight) -> bool:
         """Store a new insight in the database."""
+        return self.store_insights([insight])
+
+    def store_insights(self, insights: List[Insight]) -> bool:
+        """Store a batch of insights in a single transaction."""
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                conn.execute(
-                    """
-                    INSERT OR REPLACE INTO insights 
-                    (insight_id, insight_type, description, confidence, severity, 
-                     category, code_version, timestamp, metadata, linked_issues, linked_insights)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """,
-                    (
-                        insight.insight_id,
-                        insight.insight_type,
-                        insight.description,
-                        insight.confidence,
-                        insight.severity,
-                        insight.category,
-                        insight.code_version,
-                        insight.timestamp,
-                        json.dumps(insight.metadata),
-                        json.dumps(insight.linked_issues),
-                        json.dumps(insight.linked_insights),
-                    ),
-                )
+            rows = [insight.to_row() for insight in insights]
+            with self._lock:
+                conn = self._conn
+                conn.execute("BEGIN")
+                try:
+                    conn.executemany(_SQL_INSERT, rows)
+                except Exception:
+                    conn.execute("ROLLBACK")
+                    raise
+                conn.execute("COMMIT")
+                # Keep index statistics current as the table grows; optimize
+                # only re-analyzes when SQLite judges it worthwhile
+                self._inserts_since_optimize += len(rows)
+                if self._inserts_since_optimize >= _OPTIMIZE_EVERY:
+                    conn.execute("PRAGMA optimize")
+                    self._inserts_since_optimize = 0
                 return True
         except Exception as e:
-            print(f"Error storing insight: {e}")
+            print(f"Error storing insights: {e}")
             return False
 
+    def _query(self, sql: str, params: tuple) -> List[Insight]:
+        """Run a SELECT over the insights table and map the rows."""
+        with self._lock:
+            return [_row_to_insight(row) for row in self._conn.execute(sql, params)]
+
+    def _query_tuple(self, version: Tuple[int, int], sql: str, params: tuple):
+        # Raw rows are immutable, so the cache can hand them out safely
+        with self._lock:
+            return tuple(self._conn.execute(sql, params))
+
+    def _cached(self, sql: str, params: tuple) -> List[Insight]:
+        """Like _query, but served from the read cache for the current version.
+
+        Each call builds new Insight objects, so callers may modify them.
+        """
+        return [
+            _row_to_insight(row)
+            for row in self._cached_query(self.data_version(), sql, params)
+        ]
+
+    def _count(self, sql: str, params: tuple) -> int:
+        """Run a SELECT COUNT(*) over the insights table."""
+        with self._lock:
+            return self._conn.execute(sql, params).fetchone()[0]
+
     def get_insight(self, insight_id: str) -> Optional[Insight]:
         """Retrieve a specific insight by ID."""
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                cursor = conn.execute(
-                    """
-                    SELECT * FROM insights WHERE insight_id = ?
-                """,
-                    (insight_id,),
-                )
-                row = cursor.fetchone()
-
-                if row:
-                    return Insight(
-                        insight_id=row[0],
-                        insight_type=row[1],
-                        description=row[2],
-                        confidence=row[3],
-                        severity=row[4],
-                        category=row[5],
-                        code_version=row[6],
-                        timestamp=row[7],
-                        metadata=json.loads(row[8]),
-                        linked_issues=json.loads(row[9]),
-                        linked_insights=json.loads(row[10]),
-                    )
-                return None
+            rows = self._cached(_SQL_GET, (insight_id,))
+            return rows[0] if rows else None
         except Exception as e:
             print(f"Error retrieving insight: {e}")
             return None
@@ -145,35 +344,7 @@ class InsightsDatabase:
     ) -> List[Insight]:
         """Get insights by type."""
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                cursor = conn.execute(
-                    """
-                    SELECT * FROM insights 
-                    WHERE insight_type = ? 
-                    ORDER BY timestamp DESC 
-                    LIMIT ?
-                """,
-                    (insight_type, limit),
-                )
-
-                insights = []
-                for row in cursor.fetchall():
-                    insights.append(
-                        Insight(
-                            insight_id=row[0],
-                            insight_type=row[1],
-                            description=row[2],
-                            confidence=row[3],
-                            severity=row[4],
-                            category=row[5],
-                            code_version=row[6],
-                            timestamp=row[7],
-                            metadata=json.loads(row[8]),
-                            linked_issues=json.loads(row[9]),
-                            linked_insights=json.loads(row[10]),
-                        )
-                    )
-                return insights
+            return self._cached(_SQL_GET_BY_TYPE, (insight_type, limit))
         except Exception as e:
             print(f"Error retrieving insights by type: {e}")
             return []
@@ -183,35 +354,7 @@ class InsightsDatabase:
     ) -> List[Insight]:
         """Get insights by category."""
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                cursor = conn.execute(
-                    """
-                    SELECT * FROM insights 
-                    WHERE category = ? 
-                    ORDER BY timestamp DESC 
-                    LIMIT ?
-                """,
-                    (category, limit),
-                )
-
-                insights = []
-                for row in cursor.fetchall():
-                    insights.append(
-                        Insight(
-                            insight_id=row[0],
-                            insight_type=row[1],
-                            description=row[2],
-                            confidence=row[3],
-                            severity=row[4],
-                            category=row[5],
-                            code_version=row[6],
-                            timestamp=row[7],
-                            metadata=json.loads(row[8]),
-                            linked_issues=json.loads(row[9]),
-                            linked_insights=json.loads(row[10]),
-                        )
-                    )
-                return insights
+            return self._cached(_SQL_GET_BY_CATEGORY, (category, limit))
         except Exception as e:
             print(f"Error retrieving insights by category: {e}")
             return []
@@ -221,74 +364,39 @@ class InsightsDatabase:
     ) -> List[Insight]:
         """Get insights by code version."""
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                cursor = conn.execute(
-                    """
-                    SELECT * FROM insights 
-                    WHERE code_version = ? 
-                    ORDER BY timestamp DESC 
-                    LIMIT ?
-                """,
-                    (code_version, limit),
-                )
-
-                insights = []
-                for row in cursor.fetchall():
-                    insights.append(
-                        Insight(
-                            insight_id=row[0],
-                            insight_type=row[1],
-                            description=row[2],
-                            confidence=row[3],
-                            severity=row[4],
-                            category=row[5],
-                            code_version=row[6],
-                            timestamp=row[7],
-                            metadata=json.loads(row[8]),
-                            linked_issues=json.loads(row[9]),
-                            linked_insights=json.loads(row[10]),
-                        )
-                    )
-                return insights
+            return self._cached(_SQL_GET_BY_VERSION, (code_version, limit))
         except Exception as e:
             print(f"Error retrieving insights by version: {e}")
             return []
 
+    def count_insights_by_type(self, insight_type: str) -> int:
+        """Count insights of a type."""
+        try:
+            return self._count(_SQL_COUNT_BY_TYPE, (insight_type,))
+        except Exception as e:
+            print(f"Error counting insights by type: {e}")
+            return 0
+
+    def count_insights_by_category(self, category: str) -> int:
+        """Count insights in a category."""
+        try:
+            return self._count(_SQL_COUNT_BY_CATEGORY, (category,))
+        except Exception as e:
+            print(f"Error counting insights by category: {e}")
+            return 0
+
+    def count_insights_by_version(self, code_version: str) -> int:
+        """Count insights for a code version."""
+        try:
+            return self._count(_SQL_COUNT_BY_VERSION, (code_version,))
+        except Exception as e:
+            print(f"Error counting insights by version: {e}")
+            return 0
+
     def get_recent_insights(self, days: int = 30, limit: int = 100) -> List[Insight]:
         """Get insights from the last N days."""
         try:
-            cutoff_date = datetime.now().isoformat()
-            with sqlite3.connect(self.db_path) as conn:
-                cursor = conn.execute(
-                    """
-                    SELECT * FROM insights 
-                    WHERE timestamp >= datetime('now', '-{} days')
-                    ORDER BY timestamp DESC 
-                    LIMIT ?
-                """.format(
-                        days
-                    ),
-                    (limit,),
-                )
-
-                insights = []
-                for row in cursor.fetchall():
-                    insights.append(
-                        Insight(
-                            insight_id=row[0],
-                            insight_type=row[1],
-                            description=row[2],
-                            confidence=row[3],
-                            severity=row[4],
-                            category=row[5],
-                            code_version=row[6],
-                            timestamp=row[7],
-                            metadata=json.loads(row[8]),
-                            linked_issues=json.loads(row[9]),
-                            linked_insights=json.loads(row[10]),
-                        )
-                    )
-                return insights
+            return self._query(_SQL_GET_RECENT, (_days_ago(days), limit))
         except Exception as e:
             print(f"Error retrieving recent insights: {e}")
             return []
@@ -298,35 +406,7 @@ class InsightsDatabase:
     ) -> List[Insight]:
         """Get insights with confidence above threshold."""
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                cursor = conn.execute(
-                    """
-                    SELECT * FROM insights 
-                    WHERE confidence >= ? 
-                    ORDER BY confidence DESC, timestamp DESC 
-                    LIMIT ?
-                """,
-                    (confidence_threshold, limit),
-                )
-
-                insights = []
-                for row in cursor.fetchall():
-                    insights.append(
-                        Insight(
-                            insight_id=row[0],
-                            insight_type=row[1],
-                            description=row[2],
-                            confidence=row[3],
-                            severity=row[4],
-                            category=row[5],
-                            code_version=row[6],
-                            timestamp=row[7],
-                            metadata=json.loads(row[8]),
-                            linked_issues=json.loads(row[9]),
-                            linked_insights=json.loads(row[10]),
-                        )
-                    )
-                return insights
+            return self._cached(_SQL_GET_HIGH_CONFIDENCE, (confidence_threshold, limit))
         except Exception as e:
             print(f"Error retrieving high confidence insights: {e}")
             return []
@@ -334,47 +414,36 @@ class InsightsDatabase:
     def get_insights_summary(self) -> Dict[str, Any]:
         """Get a summary of all insights."""
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                # Get total count
-                total = conn.execute("SELECT COUNT(*) FROM insights").fetchone()[0]
-
-                # Get counts by type
-                type_counts = {}
-                cursor = conn.execute(
-                    """
-                    SELECT insight_type, COUNT(*) 
-                    FROM insights 
-                    GROUP BY insight_type
-                """
-                )
-                for row in cursor.fetchall():
-                    type_counts[row[0]] = row[1]
-
-                # Get counts by severity
-                severity_counts = {}
-                cursor = conn.execute(
-                    """
-                    SELECT severity, COUNT(*) 
-                    FROM insights 
-                    GROUP BY severity
-                """
-                )
-                for row in cursor.fetchall():
-                    severity_counts[row[0]] = row[1]
+            cached = self._summary
+            version = self.data_version()
+            if (
+                cached is not None
+                and cached[0] == version
+                and time.monotonic() - cached[1] < _SUMMARY_TTL
+            ):
+                return copy.deepcopy(cached[2])
+            with self._lock:
+                rows = self._conn.execute(_SQL_SUMMARY, (_days_ago(7),)).fetchall()
 
-                # Get average confidence
-                avg_confidence = (
-                    conn.execute("SELECT AVG(confidence) FROM insights").fetchone()[0]
-                    or 0.0
-                )
-
-                return {
-                    "total_insights": total,
-                    "by_type": type_counts,
-                    "by_severity": severity_counts,
-                    "average_confidence": avg_confidence,
-                    "recent_insights": len(self.get_recent_insights(days=7)),
-                }
+            summary = {
+                "total_insights": 0,
+                "by_type": {},
+                "by_severity": {},
+                "average_confidence": 0.0,
+                "recent_insights": 0,
+            }
+            for kind, key, count, avg in rows:
+                if kind == "type":
+                    summary["by_type"][key] = count
+                elif kind == "severity":
+                    summary["by_severity"][key] = count
+                elif kind == "total":
+                    summary["total_insights"] = count
+                    summary["average_confidence"] = avg or 0.0
+                else:
+                    summary["recent_insights"] = count
+            self._summary = (version, time.monotonic(), summary)
+            return copy.deepcopy(summary)
         except Exception as e:
             print(f"Error getting insights summary: {e}")
             return {
@@ -388,8 +457,9 @@ class InsightsDatabase:
     def delete_insight(self, insight_id: str) -> bool:
         """Delete an insight by ID."""
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                conn.execute("DELETE FROM insights WHERE insight_id = ?", (insight_id,))
+            with self._lock:
+                conn = self._conn
+                conn.execute(_SQL_DELETE, (insight_id,))
                 return True
         except Exception as e:
             print(f"Error deleting insight: {e}")
@@ -398,15 +468,9 @@ class InsightsDatabase:
     def clear_old_insights(self, days: int = 90) -> int:
         """Clear insights older than N days. Returns number of deleted insights."""
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                cursor = conn.execute(
-                    """
-                    DELETE FROM insights 
-                    WHERE timestamp < datetime('now', '-{} days')
-                """.format(
-                        days
-                    )
-                )
+            with self._lock:
+                conn = self._conn
+                cursor = conn.execute(_SQL_CLEAR_OLD, (_days_ago(days),))
                 return cursor.rowcount
         except Exception as e:
             print(f"Error clearing old insights: {e}")
@@ -57,6 +57,16 @@ class MetaTracker:
         self.issue_tracker = None  # TODO: Implement IssueTracker
         self.version_tracker = None  # TODO: Implement VersionTracker
 
+    def close(self):
+        """Close the insights database, refreshing its planner statistics."""
+        self.insights_db.close()
+
+    def __enter__(self) -> "MetaTracker":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
     def track_insight(self, insight: Insight):
         """Store a new insight with version information."""
         # Generate unique ID if not provided
@@ -1,37 +1,79 @@
 """Tests for the dashboard module."""
 
+import json
 import pytest
-import tempfile
-import os
-from datetime import datetime, timedelta
+from contextlib import contextmanager
+from datetime import datetime
+from types import SimpleNamespace
+from llm_testing import dashboard as dashboard_module
 from llm_testing.database import ResultsDatabase
 from llm_testing.dashboard import Dashboard, AlertSystem
-from llm_testing.types import EvaluationResult
+from llm_testing._factories import PERSONAS, SCENARIOS, make_result
+
+
+@pytest.fixture(scope="module")
+def shared_db():
+    """One in-memory database for the whole module."""
+    db = ResultsDatabase(":memory:")
+    yield db
+    db.close()
+
+
+@contextmanager
+def _rolled_back(db):
+    """Undo everything written to db inside the block."""
+    db.conn.execute("SAVEPOINT t")
+    try:
+        yield db
+    finally:
+        db.conn.execute("ROLLBACK TO t")
+        db.conn.execute("RELEASE t")
+
+
+@pytest.fixture(autouse=True)
+def _tx(shared_db):
+    """Roll back everything a test wrote to the shared database."""
+    with _rolled_back(shared_db):
+        yield
+
+
+@pytest.fixture(scope="module")
+def _low_score_db():
+    """In-memory database holding three low-scoring results."""
+    db = ResultsDatabase(":memory:")
+    db.store_evaluation_results_bulk(
+        [
+            make_result(
+                scenario_name=SCENARIOS[i],
+                persona_name=PERSONAS[i],
+                scores={"clarity": 2.0, "helpfulness": 2.5},  # Low scores
+            )
+            for i in range(3)
+        ]
+    )
+    yield db
+    db.close()
 
 
-class TestDashboard:
-    """Test the Dashboard class."""
+@pytest.fixture
+def low_score_db(_low_score_db):
+    """The low-score database, with each test's writes rolled back."""
+    with _rolled_back(_low_score_db) as db:
+        yield db
 
-    def setup_method(self):
+
+class _DashboardTestBase:
+    """Shared setup for tests that need a database and a dashboard."""
+
+    @pytest.fixture(autouse=True)
+    def _setup(self, shared_db):
         """Set up test database and dashboard."""
-        # Create a temporary database file
-        self.temp_dir = tempfile.mkdtemp()
-        self.db_path = os.path.join(self.temp_dir, "test_dashboard.db")
-        self.db = ResultsDatabase(self.db_path)
+        self.db = shared_db
         self.dashboard = Dashboard(self.db, alert_threshold=3.5)
 
-    def teardown_method(self):
-        """Clean up test database."""
-        # Remove temporary database file
-        if os.path.exists(self.db_path):
-            os.remove(self.db_path)
-        # Remove any other files in temp dir
-        if os.path.exists(self.temp_dir):
-            for file in os.listdir(self.temp_dir):
-                file_path = os.path.join(self.temp_dir, file)
-                if os.path.isfile(file_path):
-                    os.remove(file_path)
-            os.rmdir(self.temp_dir)
+
+class TestDashboard(_DashboardTestBase):
+    """Test the Dashboard class."""
 
     def test_get_key_metrics_empty(self):
         """Test key metrics when no data exists."""
@@ -46,21 +88,11 @@ class TestDashboard:
     def test_get_key_metrics_with_data(self):
         """Test key metrics with test data."""
         # Store some test results
-        for i in range(5):
-            result = EvaluationResult(
-                scenario_name=f"scenario_{i}",
-                persona_name=f"persona_{i}",
-                prompt=f"prompt_{i}",
-                assistant_response=f"response_{i}",
-                scores={"clarity": 4.0, "helpfulness": 4.0},
-                intermediate_scores={},
-                feedback=f"feedback_{i}",
-                timestamp=datetime.now().isoformat(),
-                code_version="test_version",
-                model_version="test_model",
-                metadata={},
-            )
-            self.db.store_evaluation_result(result)
+        results = [
+            make_result(scenario_name=SCENARIOS[i], persona_name=PERSONAS[i])
+            for i in range(5)
+        ]
+        self.db.store_evaluation_results_bulk(results)
 
         metrics = self.dashboard.get_key_metrics()
 
@@ -69,84 +101,36 @@ class TestDashboard:
         assert metrics["success_rate"] == 100.0  # All scores >= 3.5
         assert len(metrics["alerts"]) == 0
 
-    def test_get_scenario_performance(self):
-        """Test getting scenario performance breakdown."""
-        # Store results for different scenarios
-        scenarios = ["scenario_a", "scenario_b", "scenario_a"]
+    @pytest.mark.parametrize(
+        "field,getter",
+        [
+            ("scenario_name", "get_scenario_performance"),
+            ("persona_name", "get_persona_performance"),
+        ],
+    )
+    def test_group_performance(self, field, getter):
+        """Test getting the scenario and persona performance breakdowns."""
+        # Store results for different groups
+        groups = ["group_a", "group_b", "group_a"]
         scores = [4.0, 3.0, 5.0]
 
-        for i, scenario in enumerate(scenarios):
-            result = EvaluationResult(
-                scenario_name=scenario,
-                persona_name="test_persona",
-                prompt="test prompt",
-                assistant_response="test response",
-                scores={"overall": scores[i]},
-                intermediate_scores={},
-                feedback="test feedback",
-                timestamp=datetime.now().isoformat(),
-                code_version="test_version",
-                model_version="test_model",
-                metadata={},
-            )
-            self.db.store_evaluation_result(result)
+        results = [
+            make_result(**{field: group}, scores={"overall": score})
+            for group, score in zip(groups, scores)
+        ]
+        self.db.store_evaluation_results_bulk(results)
 
-        performance = self.dashboard.get_scenario_performance()
+        performance = getattr(self.dashboard, getter)()
 
-        assert "scenario_a" in performance
-        assert "scenario_b" in performance
-        assert abs(performance["scenario_a"] - 4.5) < 0.01
-        assert abs(performance["scenario_b"] - 3.0) < 0.01
-
-    def test_get_persona_performance(self):
-        """Test getting persona performance breakdown."""
-        # Store results for different personas
-        personas = ["persona_a", "persona_b", "persona_a"]
-        scores = [4.0, 3.0, 5.0]
+        assert "group_a" in performance
+        assert "group_b" in performance
+        assert abs(performance["group_a"] - 4.5) < 0.01
+        assert abs(performance["group_b"] - 3.0) < 0.01
 
-        for i, persona in enumerate(personas):
-            result = EvaluationResult(
-                scenario_name="test_scenario",
-                persona_name=persona,
-                prompt="test prompt",
-                assistant_response="test response",
-                scores={"overall": scores[i]},
-                intermediate_scores={},
-                feedback="test feedback",
-                timestamp=datetime.now().isoformat(),
-                code_version="test_version",
-                model_version="test_model",
-                metadata={},
-            )
-            self.db.store_evaluation_result(result)
-
-        performance = self.dashboard.get_persona_performance()
-
-        assert "persona_a" in performance
-        assert "persona_b" in performance
-        assert abs(performance["persona_a"] - 4.5) < 0.01
-        assert abs(performance["persona_b"] - 3.0) < 0.01
-
-    def test_get_alerts_low_score(self):
+    def test_get_alerts_low_score(self, low_score_db):
         """Test alert generation for low scores."""
-        # Store results with low scores
-        for i in range(3):
-            result = EvaluationResult(
-                scenario_name=f"scenario_{i}",
-                persona_name=f"persona_{i}",
-                prompt=f"prompt_{i}",
-                assistant_response=f"response_{i}",
-                scores={"clarity": 2.0, "helpfulness": 2.5},  # Low scores
-                intermediate_scores={},
-                feedback=f"feedback_{i}",
-                timestamp=datetime.now().isoformat(),
-                code_version="test_version",
-                model_version="test_model",
-                metadata={},
-            )
-            self.db.store_evaluation_result(result)
-
-        metrics = self.dashboard.get_key_metrics()
+        dashboard = Dashboard(low_score_db, alert_threshold=3.5)
+        metrics = dashboard.get_key_metrics()
 
         # Should have alerts for low scores
         assert len(metrics["alerts"]) > 0
@@ -155,22 +139,16 @@ class TestDashboard:
     def test_get_alerts_high_failure_rate(self):
         """Test alert generation for high failure rate."""
         # Store results with many failures
-        for i in range(10):
-            score = 2.0 if i < 6 else 4.0  # 60% failures
-            result = EvaluationResult(
-                scenario_name=f"scenario_{i}",
-                persona_name=f"persona_{i}",
-                prompt=f"prompt_{i}",
-                assistant_response=f"response_{i}",
+        scores = [2.0] * 6 + [4.0] * 4  # 60% failures
+        results = [
+            make_result(
+                scenario_name=SCENARIOS[i],
+                persona_name=PERSONAS[i],
                 scores={"clarity": score, "helpfulness": score},
-                intermediate_scores={},
-                feedback=f"feedback_{i}",
-                timestamp=datetime.now().isoformat(),
-                code_version="test_version",
-                model_version="test_model",
-                metadata={},
             )
-            self.db.store_evaluation_result(result)
+            for i, score in enumerate(scores)
+        ]
+        self.db.store_evaluation_results_bulk(results)
 
         metrics = self.dashboard.get_key_metrics()
 
@@ -183,6 +161,7 @@ class TestDashboard:
         # Store some insights
         insight_types = ["performance_pattern", "user_experience", "feature_gap"]
 
+        ts = datetime.now().isoformat()
         for insight_type in insight_types:
             insight = {
                 "insight_type": insight_type,
@@ -190,7 +169,7 @@ class TestDashboard:
                 "confidence": 0.8,
                 "evidence": [],
                 "recommendations": [],
-                "timestamp": datetime.now().isoformat(),
+                "timestamp": ts,
                 "code_version": "test_version",
                 "model_version": "test_model",
                 "linked_issues": [],
@@ -210,19 +189,7 @@ class TestDashboard:
     def test_generate_dashboard_data(self):
         """Test generating complete dashboard data."""
         # Store some test data
-        result = EvaluationResult(
-            scenario_name="test_scenario",
-            persona_name="test_persona",
-            prompt="test prompt",
-            assistant_response="test response",
-            scores={"clarity": 4.0, "helpfulness": 4.0},
-            intermediate_scores={},
-            feedback="test feedback",
-            timestamp=datetime.now().isoformat(),
-            code_version="test_version",
-            model_version="test_model",
-            metadata={},
-        )
+        result = make_result()
         self.db.store_evaluation_result(result)
 
         dashboard_data = self.dashboard.generate_dashboard_data()
@@ -234,144 +201,110 @@ class TestDashboard:
         assert "regression_alerts" in dashboard_data
         assert "last_updated" in dashboard_data
 
-    def test_export_dashboard_json(self):
+    def test_cached_metrics_follow_writes(self):
+        """Getters reuse results until the database changes."""
+        metrics = self.dashboard.get_key_metrics()
+        assert metrics["total_tests"] == 0
+
+        # Mutating a returned value must not leak into the cache
+        metrics["alerts"].append({"type": "bogus"})
+        assert self.dashboard.get_key_metrics()["alerts"] == []
+
+        self.db.store_evaluation_result(make_result())
+        assert self.dashboard.get_key_metrics()["total_tests"] == 1
+
+    def test_cached_metrics_expire(self, monkeypatch):
+        """Getters recompute once the cache TTL passes, even without writes."""
+        clock = [1000.0]
+        monkeypatch.setattr(
+            dashboard_module, "time", SimpleNamespace(monotonic=lambda: clock[0])
+        )
+        calls = []
+        monkeypatch.setattr(
+            self.db,
+            "get_average_scores_by_scenario",
+            lambda days=7: calls.append(days) or {},
+        )
+
+        self.dashboard.get_scenario_performance()
+        self.dashboard.get_scenario_performance()
+        assert len(calls) == 1
+
+        clock[0] += dashboard_module._CACHE_TTL
+        self.dashboard.get_scenario_performance()
+        assert len(calls) == 2
+
+    def test_cached_metrics_follow_rolled_back_ids(self):
+        """A rolled-back insert whose id is reused still invalidates the cache."""
+        with _rolled_back(self.db):
+            self.db.store_evaluation_result(make_result())
+            assert self.dashboard.get_key_metrics()["average_score"] == 4.0
+        self.db.store_evaluation_result(
+            make_result(scores={"clarity": 2.0, "helpfulness": 2.0})
+        )
+        assert self.dashboard.get_key_metrics()["average_score"] == 2.0
+
+    def test_export_dashboard_json(self, tmp_path):
         """Test exporting dashboard data to JSON."""
         # Store some test data
-        result = EvaluationResult(
-            scenario_name="test_scenario",
-            persona_name="test_persona",
-            prompt="test prompt",
-            assistant_response="test response",
-            scores={"clarity": 4.0, "helpfulness": 4.0},
-            intermediate_scores={},
-            feedback="test feedback",
-            timestamp=datetime.now().isoformat(),
-            code_version="test_version",
-            model_version="test_model",
-            metadata={},
-        )
+        result = make_result()
         self.db.store_evaluation_result(result)
 
         # Export to temporary file
-        temp_file = os.path.join(self.temp_dir, "dashboard.json")
-        self.dashboard.export_dashboard_json(temp_file)
+        temp_file = tmp_path / "dashboard.json"
+        self.dashboard.export_dashboard_json(str(temp_file))
 
         # Verify file was created
-        assert os.path.exists(temp_file)
+        assert temp_file.exists()
 
         # Verify file contains valid JSON
-        import json
-
         with open(temp_file, "r") as f:
             data = json.load(f)
             assert "key_metrics" in data
 
 
-class TestAlertSystem:
+class TestAlertSystem(_DashboardTestBase):
     """Test the AlertSystem class."""
 
-    def setup_method(self):
-        """Set up test database, dashboard, and alert system."""
-        # Create a temporary database file
-        self.temp_dir = tempfile.mkdtemp()
-        self.db_path = os.path.join(self.temp_dir, "test_alerts.db")
-        self.db = ResultsDatabase(self.db_path)
-        self.dashboard = Dashboard(self.db, alert_threshold=3.5)
+    @pytest.fixture(autouse=True)
+    def _setup_alerts(self, _setup):
+        """Set up the alert system on top of the dashboard."""
         self.alert_system = AlertSystem(self.dashboard)
 
-    def teardown_method(self):
-        """Clean up test database."""
-        # Remove temporary database file
-        if os.path.exists(self.db_path):
-            os.remove(self.db_path)
-        # Remove any other files in temp dir
-        if os.path.exists(self.temp_dir):
-            for file in os.listdir(self.temp_dir):
-                file_path = os.path.join(self.temp_dir, file)
-                if os.path.isfile(file_path):
-                    os.remove(file_path)
-            os.rmdir(self.temp_dir)
-
     def test_check_alerts_no_alerts(self):
         """Test checking alerts when no alerts exist."""
         new_alerts = self.alert_system.check_alerts()
         assert len(new_alerts) == 0
 
-    def test_check_alerts_with_alerts(self):
+    def test_check_alerts_with_alerts(self, low_score_db):
         """Test checking alerts when alerts exist."""
-        # Create low scores to trigger alerts
-        for i in range(3):
-            result = EvaluationResult(
-                scenario_name=f"scenario_{i}",
-                persona_name=f"persona_{i}",
-                prompt=f"prompt_{i}",
-                assistant_response=f"response_{i}",
-                scores={"clarity": 2.0, "helpfulness": 2.5},  # Low scores
-                intermediate_scores={},
-                feedback=f"feedback_{i}",
-                timestamp=datetime.now().isoformat(),
-                code_version="test_version",
-                model_version="test_model",
-                metadata={},
-            )
-            self.db.store_evaluation_result(result)
-
-        new_alerts = self.alert_system.check_alerts()
+        alert_system = AlertSystem(Dashboard(low_score_db, alert_threshold=3.5))
+        new_alerts = alert_system.check_alerts()
 
         # Should have new alerts
         assert len(new_alerts) > 0
 
-    def test_process_alerts(self):
+    def test_process_alerts(self, low_score_db):
         """Test processing alerts."""
-        # Create low scores to trigger alerts
-        for i in range(3):
-            result = EvaluationResult(
-                scenario_name=f"scenario_{i}",
-                persona_name=f"persona_{i}",
-                prompt=f"prompt_{i}",
-                assistant_response=f"response_{i}",
-                scores={"clarity": 2.0, "helpfulness": 2.5},  # Low scores
-                intermediate_scores={},
-                feedback=f"feedback_{i}",
-                timestamp=datetime.now().isoformat(),
-                code_version="test_version",
-                model_version="test_model",
-                metadata={},
-            )
-            self.db.store_evaluation_result(result)
+        alert_system = AlertSystem(Dashboard(low_score_db, alert_threshold=3.5))
 
         # Process alerts
-        self.alert_system.process_alerts()
+        alert_system.process_alerts()
 
         # Should have alert history
-        assert len(self.alert_system.get_alert_history()) > 0
+        assert len(alert_system.get_alert_history()) > 0
 
-    def test_clear_resolved_alerts(self):
+    def test_clear_resolved_alerts(self, low_score_db):
         """Test clearing resolved alerts."""
-        # Create alerts
-        for i in range(3):
-            result = EvaluationResult(
-                scenario_name=f"scenario_{i}",
-                persona_name=f"persona_{i}",
-                prompt=f"prompt_{i}",
-                assistant_response=f"response_{i}",
-                scores={"clarity": 2.0, "helpfulness": 2.5},  # Low scores
-                intermediate_scores={},
-                feedback=f"feedback_{i}",
-                timestamp=datetime.now().isoformat(),
-                code_version="test_version",
-                model_version="test_model",
-                metadata={},
-            )
-            self.db.store_evaluation_result(result)
+        alert_system = AlertSystem(Dashboard(low_score_db, alert_threshold=3.5))
 
         # Process alerts to create history
-        self.alert_system.process_alerts()
-        initial_history_count = len(self.alert_system.get_alert_history())
+        alert_system.process_alerts()
+        initial_history_count = len(alert_system.get_alert_history())
 
         # Clear resolved alerts
-        self.alert_system.clear_resolved_alerts()
+        alert_system.clear_resolved_alerts()
 
         # History should be cleared if alerts are resolved
         # (This depends on the current state of alerts)
-        assert len(self.alert_system.get_alert_history()) <= initial_history_count
+        assert len(alert_system.get_alert_history()) <= initial_history_count
@@ -1,40 +1,123 @@
 """Tests for the InsightsDatabase module."""
 
 import pytest
-import tempfile
-import os
 from datetime import datetime
+from llm_testing import insights_database, meta_tracker
 from llm_testing.insights_database import InsightsDatabase, Insight
 
 
+@pytest.fixture
+def sql_trace(monkeypatch):
+    """Statements run on every connection InsightsDatabase opens."""
+    statements = []
+    connect = insights_database.sqlite3.connect
+
+    def traced_connect(*args, **kwargs):
+        conn = connect(*args, **kwargs)
+        conn.set_trace_callback(statements.append)
+        return conn
+
+    monkeypatch.setattr(insights_database.sqlite3, "connect", traced_connect)
+    return statements
+
+
+@pytest.fixture(scope="class")
+def shared_db():
+    """One in-memory database for the whole test class."""
+    db = InsightsDatabase(":memory:")
+    yield db
+    db.close()
+
+
 class TestInsightsDatabase:
     """Test the InsightsDatabase functionality."""
 
-    def setup_method(self):
-        """Set up test fixtures."""
-        # Create a temporary database file
-        self.temp_dir = tempfile.mkdtemp()
-        self.db_path = os.path.join(self.temp_dir, "test_insights.db")
-        self.db = InsightsDatabase(self.db_path)
-
-    def teardown_method(self):
-        """Clean up test fixtures."""
-        # Remove the database file
-        if os.path.exists(self.db_path):
-            os.remove(self.db_path)
-        # Remove the temp directory
-        if os.path.exists(self.temp_dir):
-            os.rmdir(self.temp_dir)
+    @pytest.fixture(autouse=True)
+    def _setup(self, shared_db):
+        """Hand each test the shared database and empty it afterwards."""
+        self.db = shared_db
+        yield
+        shared_db._conn.execute("DELETE FROM insights")
+        shared_db.invalidate_cache()
 
     def test_create_tables(self):
         """Test that tables are created correctly."""
-        # The database should be created in setup_method
-        assert os.path.exists(self.db_path)
+        # The table should be created in setup_method
+        tables = self.db._conn.execute(
+            "SELECT name FROM sqlite_master WHERE type = 'table'"
+        ).fetchall()
+        assert ("insights",) in tables
 
         # Check that we can query the table
         insights = self.db.get_insights_by_type("test")
         assert isinstance(insights, list)
 
+    @pytest.mark.parametrize(
+        "sql, params",
+        [
+            (insights_database._SQL_GET_BY_TYPE, ("performance", 10)),
+            (insights_database._SQL_GET_BY_CATEGORY, ("persona", 10)),
+            (insights_database._SQL_GET_BY_VERSION, ("0.1.0", 10)),
+            (insights_database._SQL_GET_HIGH_CONFIDENCE, (0.8, 10)),
+            (insights_database._SQL_GET_RECENT, ("-30 days", 10)),
+            (insights_database._SQL_CLEAR_OLD, ("-90 days",)),
+        ],
+    )
+    def test_queries_use_indexes(self, sql, params):
+        """Test that the filtered queries seek an index instead of scanning."""
+        plan = self.db._conn.execute("EXPLAIN QUERY PLAN " + sql, params).fetchall()
+        assert any("USING INDEX" in row[-1] for row in plan), plan
+
+    def test_journal_modes(self, tmp_path):
+        """File databases use WAL unless opened in fast mode."""
+        durable = InsightsDatabase(str(tmp_path / "durable.db"))
+        fast = InsightsDatabase(str(tmp_path / "fast.db"), fast=True)
+        try:
+            assert durable._conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+            assert fast._conn.execute("PRAGMA journal_mode").fetchone()[0] == "memory"
+            assert fast._conn.execute("PRAGMA synchronous").fetchone()[0] == 0
+        finally:
+            durable.close()
+            fast.close()
+
+    def test_analyze_runs_only_when_indexes_change(self, tmp_path, sql_trace):
+        """Re-opening an analyzed db does not rescan it; upgrading does."""
+        path = str(tmp_path / "insights.db")
+        connect = insights_database.sqlite3.connect
+
+        def analyzed_on_open():
+            sql_trace.clear()
+            InsightsDatabase(path).close()
+            return "ANALYZE" in sql_trace
+
+        assert analyzed_on_open()  # new db, no statistics yet
+        assert not analyzed_on_open()
+
+        conn = connect(path)
+        conn.execute("CREATE INDEX idx_category ON insights(category)")
+        conn.close()
+        assert analyzed_on_open()  # old index replaced
+        assert not analyzed_on_open()
+
+    def test_context_manager_optimizes_and_closes(self, tmp_path, sql_trace):
+        """Leaving the with block refreshes statistics and closes the db."""
+        with InsightsDatabase(str(tmp_path / "insights.db")) as db:
+            sql_trace.clear()
+        assert "PRAGMA optimize" in sql_trace
+        with pytest.raises(insights_database.sqlite3.ProgrammingError):
+            db._conn.execute("SELECT 1")
+
+    def test_meta_tracker_closes_insights_db(self, monkeypatch, sql_trace):
+        """MetaTracker owns its InsightsDatabase and closes it on exit."""
+        monkeypatch.setattr(
+            meta_tracker, "InsightsDatabase", lambda: InsightsDatabase(":memory:")
+        )
+        with meta_tracker.MetaTracker(config=None) as tracker:
+            sql_trace.clear()
+        assert "PRAGMA optimize" in sql_trace
+        with pytest.raises(insights_database.sqlite3.ProgrammingError):
+            tracker.insights_db._conn.execute("SELECT 1")
+
     def test_store_and_retrieve_insight(self):
         """Test storing and retrieving a single insight."""
         insight = Insight(
@@ -68,104 +151,80 @@ class TestInsightsDatabase:
         assert retrieved.linked_issues == ["issue-1"]
         assert retrieved.linked_insights == ["insight-2"]
 
-    def test_get_insights_by_type(self):
-        """Test retrieving insights by type."""
-        # Create multiple insights
+    @pytest.mark.parametrize(
+        "field, kind, matching, other",
+        [
+            ("insight_type", "type", "performance", "accessibility"),
+            ("category", "category", "persona", "scenario"),
+            ("code_version", "version", "0.1.0", "0.2.0"),
+        ],
+    )
+    def test_get_insights_by(self, field, kind, matching, other):
+        """Test retrieving and counting insights by type, category and version."""
+        base = dict(
+            insight_type="performance",
+            description="Test insight",
+            confidence=0.8,
+            severity="medium",
+            category="persona",
+            code_version="0.1.0",
+            timestamp=datetime.now().isoformat(),
+        )
+        # Alternate the field under test: 0, 2, 4 match and 1, 3 do not
         insights = [
             Insight(
-                insight_id=f"test-{i}",
-                insight_type="performance" if i % 2 == 0 else "accessibility",
-                description=f"Test insight {i}",
-                confidence=0.7 + (i * 0.1),
-                severity="medium",
-                category="persona",
-                code_version="0.1.0",
-                timestamp=datetime.now().isoformat(),
-                metadata={"test": i},
-                linked_issues=[],
-                linked_insights=[],
+                **{
+                    **base,
+                    field: matching if i % 2 == 0 else other,
+                    "insight_id": f"test-{i}",
+                    "metadata": {"test": i},
+                }
             )
             for i in range(5)
         ]
 
         # Store all insights
-        for insight in insights:
-            self.db.store_insight(insight)
-
-        # Get performance insights
-        performance_insights = self.db.get_insights_by_type("performance")
-        assert len(performance_insights) == 3  # 0, 2, 4
-
-        # Get accessibility insights
-        accessibility_insights = self.db.get_insights_by_type("accessibility")
-        assert len(accessibility_insights) == 2  # 1, 3
-
-    def test_get_insights_by_category(self):
-        """Test retrieving insights by category."""
-        # Create insights with different categories
-        insights = [
-            Insight(
-                insight_id=f"test-{i}",
-                insight_type="performance",
-                description=f"Test insight {i}",
-                confidence=0.8,
-                severity="medium",
-                category="persona" if i % 2 == 0 else "scenario",
-                code_version="0.1.0",
-                timestamp=datetime.now().isoformat(),
-                metadata={"test": i},
-                linked_issues=[],
-                linked_insights=[],
-            )
-            for i in range(4)
-        ]
-
-        # Store all insights
-        for insight in insights:
-            self.db.store_insight(insight)
+        assert self.db.store_insights(insights)
 
-        # Get persona insights
-        persona_insights = self.db.get_insights_by_category("persona")
-        assert len(persona_insights) == 2  # 0, 2
+        # Get the matching insights
+        found = getattr(self.db, f"get_insights_by_{kind}")(matching)
+        assert len(found) == 3  # 0, 2, 4
+        assert all(getattr(insight, field) == matching for insight in found)
 
-        # Get scenario insights
-        scenario_insights = self.db.get_insights_by_category("scenario")
-        assert len(scenario_insights) == 2  # 1, 3
+        # Count the others
+        assert getattr(self.db, f"count_insights_by_{kind}")(other) == 2  # 1, 3
 
-    def test_get_insights_by_version(self):
-        """Test retrieving insights by code version."""
-        # Create insights with different versions
+    def test_store_insights_batch(self):
+        """Test storing several insights in one call."""
+        ts = datetime.now().isoformat()
         insights = [
             Insight(
-                insight_id=f"test-{i}",
+                insight_id=f"batch-{i}",
                 insight_type="performance",
-                description=f"Test insight {i}",
+                description=f"Batch insight {i}",
                 confidence=0.8,
                 severity="medium",
                 category="persona",
-                code_version="0.1.0" if i % 2 == 0 else "0.2.0",
-                timestamp=datetime.now().isoformat(),
+                code_version="0.1.0",
+                timestamp=ts,
                 metadata={"test": i},
-                linked_issues=[],
+                linked_issues=[f"issue-{i}"],
                 linked_insights=[],
             )
-            for i in range(4)
+            for i in range(5)
         ]
 
-        # Store all insights
-        for insight in insights:
-            self.db.store_insight(insight)
-
-        # Get v0.1.0 insights
-        v1_insights = self.db.get_insights_by_version("0.1.0")
-        assert len(v1_insights) == 2  # 0, 2
+        assert self.db.store_insights(insights)
+        assert self.db.count_insights_by_type("performance") == 5
 
-        # Get v0.2.0 insights
-        v2_insights = self.db.get_insights_by_version("0.2.0")
-        assert len(v2_insights) == 2  # 1, 3
+        retrieved = self.db.get_insight("batch-3")
+        assert retrieved is not None
+        assert retrieved.metadata == {"test": 3}
+        assert retrieved.linked_issues == ["issue-3"]
 
     def test_get_high_confidence_insights(self):
         """Test retrieving high confidence insights."""
+        ts = datetime.now().isoformat()
         # Create insights with different confidence levels
         insights = [
             Insight(
@@ -176,7 +235,7 @@ class TestInsightsDatabase:
                 severity="medium",
                 category="persona",
                 code_version="0.1.0",
-                timestamp=datetime.now().isoformat(),
+                timestamp=ts,
                 metadata={"test": i},
                 linked_issues=[],
                 linked_insights=[],
@@ -185,8 +244,7 @@ class TestInsightsDatabase:
         ]
 
         # Store all insights
-        for insight in insights:
-            self.db.store_insight(insight)
+        assert self.db.store_insights(insights)
 
         # Get high confidence insights (>= 0.8)
         high_confidence = self.db.get_high_confidence_insights(0.8)
@@ -197,6 +255,7 @@ class TestInsightsDatabase:
 
     def test_get_insights_summary(self):
         """Test getting insights summary."""
+        ts = datetime.now().isoformat()
         # Create insights with different types and severities
         insights = [
             Insight(
@@ -207,7 +266,7 @@ class TestInsightsDatabase:
                 severity="high" if i % 3 == 0 else "medium",
                 category="persona",
                 code_version="0.1.0",
-                timestamp=datetime.now().isoformat(),
+                timestamp=ts,
                 metadata={"test": i},
                 linked_issues=[],
                 linked_insights=[],
@@ -216,8 +275,7 @@ class TestInsightsDatabase:
         ]
 
         # Store all insights
-        for insight in insights:
-            self.db.store_insight(insight)
+        assert self.db.store_insights(insights)
 
         # Get summary
         summary = self.db.get_insights_summary()
@@ -257,6 +315,94 @@ class TestInsightsDatabase:
         # Verify it's deleted
         assert self.db.get_insight("test-delete") is None
 
+    def test_cached_reads_see_writes(self):
+        """Test that cached query results are invalidated by mutations."""
+        insight = Insight(
+            insight_id="test-cache",
+            insight_type="performance",
+            description="Before update",
+            confidence=0.8,
+            severity="medium",
+            category="persona",
+            code_version="0.1.0",
+            timestamp=datetime.now().isoformat(),
+            metadata={},
+        )
+        self.db.store_insight(insight)
+        assert self.db.get_insight("test-cache").description == "Before update"
+        assert len(self.db.get_insights_by_type("performance")) == 1
+
+        insight.description = "After update"
+        self.db.store_insight(insight)
+        assert self.db.get_insight("test-cache").description == "After update"
+
+        self.db.delete_insight("test-cache")
+        assert self.db.get_insight("test-cache") is None
+        assert self.db.get_insights_by_type("performance") == []
+        assert self.db.get_insights_summary()["total_insights"] == 0
+
+    def test_cached_reads_see_other_connections(self, tmp_path):
+        """Test that writes through another connection invalidate the cache."""
+        path = str(tmp_path / "insights.db")
+        reader, writer = InsightsDatabase(path), InsightsDatabase(path)
+        try:
+            insight = Insight(
+                insight_id="test-shared",
+                insight_type="performance",
+                description="Before update",
+                confidence=0.8,
+                severity="medium",
+                category="persona",
+                code_version="0.1.0",
+                timestamp=datetime.now().isoformat(),
+                metadata={},
+            )
+            writer.store_insight(insight)
+            assert reader.get_insight("test-shared").description == "Before update"
+            assert reader.get_insights_summary()["total_insights"] == 1
+
+            insight.description = "After update"
+            writer.store_insight(insight)
+            assert reader.get_insight("test-shared").description == "After update"
+
+            writer.delete_insight("test-shared")
+            assert reader.get_insight("test-shared") is None
+            assert reader.get_insights_summary()["total_insights"] == 0
+        finally:
+            reader.close()
+            writer.close()
+
+    def test_cached_reads_return_fresh_objects(self):
+        """Test that modifying a returned insight does not leak into later reads."""
+        insight = Insight(
+            insight_id="test-fresh",
+            insight_type="performance",
+            description="Original",
+            confidence=0.8,
+            severity="medium",
+            category="persona",
+            code_version="0.1.0",
+            timestamp=datetime.now().isoformat(),
+            metadata={"key": "value"},
+            linked_issues=["issue-1"],
+        )
+        self.db.store_insight(insight)
+
+        first = self.db.get_insight("test-fresh")
+        first.metadata["key"] = "changed"
+        first.linked_issues.append("issue-2")
+        first.description = "Changed"
+        self.db.get_insights_by_type("performance")[0].metadata.clear()
+
+        again = self.db.get_insight("test-fresh")
+        assert again is not first
+        assert again.description == "Original"
+        assert again.metadata == {"key": "value"}
+        assert again.linked_issues == ["issue-1"]
+        assert self.db.get_insights_by_type("performance")[0].metadata == {
+            "key": "value"
+        }
+
     def test_clear_old_insights(self):
         """Test clearing old insights."""
         # Create insights with different timestamps
@@ -283,16 +429,14 @@ class TestInsightsDatabase:
         ]
 
         # Store all insights
-        for insight in insights:
-            self.db.store_insight(insight)
+        assert self.db.store_insights(insights)
 
         # Clear insights older than 15 days
         deleted_count = self.db.clear_old_insights(15)
         assert deleted_count == 2  # 20 and 30 days ago
 
         # Verify remaining insights
-        remaining = self.db.get_insights_by_type("performance")
-        assert len(remaining) == 2  # 0 and 10 days ago
+        assert self.db.count_insights_by_type("performance") == 2  # 0 and 10 days ago
 
     def test_error_handling(self):
         """Test error handling in database operations."""
@@ -1,9 +1,9 @@
 """Integration tests for the LLM testing framework."""
 
 import pytest
-import tempfile
-import os
+import sqlite3
 from datetime import datetime
+from types import SimpleNamespace
 from llm_testing.config import TestingConfig
 from llm_testing.personas import Persona
 from llm_testing.scenarios import Scenario, TestPrompt, ExpectedBehavior
@@ -14,15 +14,23 @@ from llm_testing.database import ResultsDatabase
 from llm_testing.dashboard import Dashboard, AlertSystem
 from llm_testing.types import EvaluationResult
 
+# Stand-ins for the assistant; the loop only calls generate_response
+_MEETING_CLIENT = SimpleNamespace(
+    generate_response=lambda prompt: "I'll schedule a team meeting for tomorrow at 2pm."
+)
+_BATCH_CLIENT = SimpleNamespace(
+    generate_response=lambda prompt: "I'll schedule that meeting for you."
+)
+
 
 class TestLLMTestingFrameworkIntegration:
     """Test the complete LLM testing framework integration."""
 
     def setup_method(self):
         """Set up test environment."""
-        # Create temporary database
-        self.temp_dir = tempfile.mkdtemp()
-        self.db_path = os.path.join(self.temp_dir, "test_integration.db")
+        # Each test opens a single connection, so an in-memory database lasts
+        # exactly as long as the test needs it
+        self.db_path = ":memory:"
 
         # Create test configuration
         self.config = TestingConfig(
@@ -32,19 +40,6 @@ class TestLLMTestingFrameworkIntegration:
             alert_threshold=3.5,
         )
 
-    def teardown_method(self):
-        """Clean up test environment."""
-        # Remove temporary database file
-        if os.path.exists(self.db_path):
-            os.remove(self.db_path)
-        # Remove any other files in temp dir
-        if os.path.exists(self.temp_dir):
-            for file in os.listdir(self.temp_dir):
-                file_path = os.path.join(self.temp_dir, file)
-                if os.path.isfile(file_path):
-                    os.remove(file_path)
-            os.rmdir(self.temp_dir)
-
     def test_framework_components_integration(self):
         """Test that all framework components work together."""
         # Create test persona
@@ -106,11 +101,7 @@ class TestLLMTestingFrameworkIntegration:
         scoring_agent = ScoringAgent(self.config)
 
         # Create mock assistant client
-        class MockAssistantClient:
-            def generate_response(self, prompt: str) -> str:
-                return "I'll schedule a team meeting for tomorrow at 2pm."
-
-        assistant_client = MockAssistantClient()
+        assistant_client = _MEETING_CLIENT
 
         # Create evaluation loop
         evaluation_loop = EvaluationLoop(
@@ -182,33 +173,38 @@ class TestLLMTestingFrameworkIntegration:
         assert len(recent_results) == 1
         assert recent_results[0].scenario_name == "test_scenario"
 
-    def test_dashboard_metrics(self):
-        """Test dashboard metrics calculation."""
+    def test_dashboard_metrics_and_alerts(self):
+        """Test dashboard metrics and the alert system over one database."""
         db = ResultsDatabase(self.db_path)
         dashboard = Dashboard(db, alert_threshold=3.5)
+        alert_system = AlertSystem(dashboard)
 
         # Store test data
-        for i in range(5):
-            result = EvaluationResult(
-                scenario_name=f"scenario_{i}",
-                persona_name=f"persona_{i}",
-                prompt=f"prompt_{i}",
-                assistant_response=f"response_{i}",
-                scores={"clarity": 4.0, "helpfulness": 4.0},
-                intermediate_scores={},
-                feedback=f"feedback_{i}",
-                timestamp=datetime.now().isoformat(),
-                code_version="test_version",
-                model_version="test_model",
-                metadata={},
-            )
-            db.store_evaluation_result(result)
+        db.store_evaluation_results_bulk(
+            [
+                EvaluationResult(
+                    scenario_name=f"scenario_{i}",
+                    persona_name=f"persona_{i}",
+                    prompt=f"prompt_{i}",
+                    assistant_response=f"response_{i}",
+                    scores={"clarity": 4.0, "helpfulness": 4.0},
+                    intermediate_scores={},
+                    feedback=f"feedback_{i}",
+                    timestamp=datetime.now().isoformat(),
+                    code_version="test_version",
+                    model_version="test_model",
+                    metadata={},
+                )
+                for i in range(5)
+            ]
+        )
 
         # Check metrics
         metrics = dashboard.get_key_metrics()
         assert metrics["total_tests"] == 5
         assert metrics["average_score"] == 4.0
         assert metrics["success_rate"] == 100.0
+        assert alert_system.check_alerts() == []
 
         # Check performance breakdowns
         scenario_performance = dashboard.get_scenario_performance()
@@ -217,28 +213,25 @@ class TestLLMTestingFrameworkIntegration:
         persona_performance = dashboard.get_persona_performance()
         assert len(persona_performance) == 5
 
-    def test_alert_system_integration(self):
-        """Test alert system integration."""
-        db = ResultsDatabase(self.db_path)
-        dashboard = Dashboard(db, alert_threshold=3.5)
-        alert_system = AlertSystem(dashboard)
-
         # Create low scores to trigger alerts
-        for i in range(3):
-            result = EvaluationResult(
-                scenario_name=f"scenario_{i}",
-                persona_name=f"persona_{i}",
-                prompt=f"prompt_{i}",
-                assistant_response=f"response_{i}",
-                scores={"clarity": 2.0, "helpfulness": 2.5},  # Low scores
-                intermediate_scores={},
-                feedback=f"feedback_{i}",
-                timestamp=datetime.now().isoformat(),
-                code_version="test_version",
-                model_version="test_model",
-                metadata={},
-            )
-            db.store_evaluation_result(result)
+        db.store_evaluation_results_bulk(
+            [
+                EvaluationResult(
+                    scenario_name=f"low_scenario_{i}",
+                    persona_name=f"persona_{i}",
+                    prompt=f"prompt_{i}",
+                    assistant_response=f"response_{i}",
+                    scores={"clarity": 2.0, "helpfulness": 2.5},  # Low scores
+                    intermediate_scores={},
+                    feedback=f"feedback_{i}",
+                    timestamp=datetime.now().isoformat(),
+                    code_version="test_version",
+                    model_version="test_model",
+                    metadata={},
+                )
+                for i in range(3)
+            ]
+        )
 
         # Check for alerts
         new_alerts = alert_system.check_alerts()
@@ -296,11 +289,7 @@ class TestLLMTestingFrameworkIntegration:
         # Create evaluation loop
         scoring_agent = ScoringAgent(self.config)
 
-        class MockAssistantClient:
-            def generate_response(self, prompt: str) -> str:
-                return "I'll schedule that meeting for you."
-
-        assistant_client = MockAssistantClient()
+        assistant_client = _BATCH_CLIENT
 
         evaluation_loop = EvaluationLoop(
             assistant_client=assistant_client,
@@ -319,3 +308,15 @@ class TestLLMTestingFrameworkIntegration:
         # Check database storage
         recent_results = evaluation_loop.results_db.get_recent_results(limit=10)
         assert len(recent_results) == 3
+
+    def test_evaluation_loop_closes_results_db(self):
+        """The loop's results database is closed when the loop is."""
+        with EvaluationLoop(
+            assistant_client=_BATCH_CLIENT,
+            scoring_agent=ScoringAgent(self.config),
+            config=self.config,
+        ) as evaluation_loop:
+            assert evaluation_loop.results_db.get_recent_results(limit=1) == []
+
+        with pytest.raises(sqlite3.ProgrammingError):
+            evaluation_loop.results_db.conn.execute("SELECT 1")
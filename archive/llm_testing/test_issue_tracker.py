@@ -1,61 +1,39 @@
 """Tests for the IssueTracker module."""
 
 import pytest
-import tempfile
+import copy
 import os
 import json
-from datetime import datetime
 from unittest.mock import patch, MagicMock
 from llm_testing.issue_tracker import IssueTracker, IssueTemplate
-from llm_testing.insights_database import Insight
+from llm_testing._factories import make_insight
+
+
+_CONFIG = {
+    "github_token": "test_token",
+    "github_repo": "test/repo",
+    "gitlab_token": "test_gitlab_token",
+    "gitlab_project": "test/project",
+}
+
+
+@pytest.fixture(scope="module")
+def tracker_proto():
+    """One IssueTracker for the module; tests get shallow copies of it."""
+    return IssueTracker(_CONFIG)
 
 
 class TestIssueTracker:
     """Test the IssueTracker functionality."""
 
-    def setup_method(self):
+    @pytest.fixture(autouse=True)
+    def _setup(self, tmp_path, monkeypatch, tracker_proto):
         """Set up test fixtures."""
-        self.temp_dir = tempfile.mkdtemp()
-        self.config = {
-            "github_token": "test_token",
-            "github_repo": "test/repo",
-            "gitlab_token": "test_gitlab_token",
-            "gitlab_project": "test/project",
-        }
-        self.issue_tracker = IssueTracker(self.config)
-
-    def teardown_method(self):
-        """Clean up test fixtures."""
-        # Clean up any created files
-        if os.path.exists("issues"):
-            for file in os.listdir("issues"):
-                os.remove(os.path.join("issues", file))
-            os.rmdir("issues")
-
-        # Remove temp directory
-        if os.path.exists(self.temp_dir):
-            os.rmdir(self.temp_dir)
-
-    def create_test_insight(
-        self,
-        insight_type: str = "performance_regression",
-        severity: str = "high",
-        confidence: float = 0.8,
-    ) -> Insight:
-        """Create a test insight."""
-        return Insight(
-            insight_id=f"test-{insight_type}",
-            insight_type=insight_type,
-            description=f"Test {insight_type} insight",
-            confidence=confidence,
-            severity=severity,
-            category="performance",
-            code_version="0.1.0",
-            timestamp=datetime.now().isoformat(),
-            metadata={"test": True, "trend": "declining"},
-            linked_issues=[],
-            linked_insights=[],
-        )
+        # Local issues are written under ./issues; run each test in its own
+        # directory so they never leak into the checkout or between tests
+        monkeypatch.chdir(tmp_path)
+        # The copy shares the prototype's templates, which no test modifies
+        self.issue_tracker = copy.copy(tracker_proto)
 
     def test_issue_tracker_initialization(self):
         """Test IssueTracker initialization."""
@@ -87,22 +65,22 @@ class TestIssueTracker:
     def test_get_template_for_insight(self):
         """Test getting appropriate template for different insight types."""
         # Performance regression
-        insight = self.create_test_insight("performance_regression")
+        insight = make_insight("performance_regression")
         template = self.issue_tracker._get_template_for_insight(insight)
         assert template.title == "Performance Regression Detected"
 
         # Clarity decline
-        insight = self.create_test_insight("clarity_decline")
+        insight = make_insight("clarity_decline")
         template = self.issue_tracker._get_template_for_insight(insight)
         assert template.title == "Response Clarity Decline"
 
         # Accessibility issue
-        insight = self.create_test_insight("accessibility_issue")
+        insight = make_insight("accessibility_issue")
         template = self.issue_tracker._get_template_for_insight(insight)
         assert template.title == "Accessibility Issue Identified"
 
         # Unknown type
-        insight = self.create_test_insight("unknown_type")
+        insight = make_insight("unknown_type")
         template = self.issue_tracker._get_template_for_insight(insight)
         assert template.title == "Issue: unknown_type"
 
@@ -126,7 +104,7 @@ class TestIssueTracker:
 
     def test_generate_description(self):
         """Test issue description generation."""
-        insight = self.create_test_insight("performance_regression", "high", 0.9)
+        insight = make_insight("performance_regression", "high", 0.9)
         template = self.issue_tracker.issue_templates["performance_regression"]
 
         description = self.issue_tracker._generate_description(insight, template)
@@ -144,7 +122,7 @@ class TestIssueTracker:
 
     def test_generate_issue_content(self):
         """Test issue content generation."""
-        insight = self.create_test_insight("performance_regression", "critical", 0.9)
+        insight = make_insight("performance_regression", "critical", 0.9)
         template = self.issue_tracker.issue_templates["performance_regression"]
 
         content = self.issue_tracker._generate_issue_content(insight, template)
@@ -161,7 +139,7 @@ class TestIssueTracker:
 
     def test_create_local_issue(self):
         """Test local issue creation."""
-        insight = self.create_test_insight("performance_regression")
+        insight = make_insight("performance_regression")
         template = self.issue_tracker._get_template_for_insight(insight)
         issue_content = self.issue_tracker._generate_issue_content(insight, template)
 
@@ -187,11 +165,9 @@ class TestIssueTracker:
         local_tracker = IssueTracker(local_config)
 
         insights = [
-            self.create_test_insight("performance_regression", "high", 0.8),
-            self.create_test_insight(
-                "clarity_decline", "medium", 0.6
-            ),  # Should be filtered out
-            self.create_test_insight("accuracy_issue", "critical", 0.9),
+            make_insight("performance_regression", "high", 0.8),
+            make_insight("clarity_decline", "medium", 0.6),  # Should be filtered out
+            make_insight("accuracy_issue", "critical", 0.9),
         ]
 
         issue_urls = local_tracker.create_issues_from_insights(insights)
@@ -207,13 +183,9 @@ class TestIssueTracker:
         local_tracker = IssueTracker(local_config)
 
         insights = [
-            self.create_test_insight(
-                "performance_regression", "low", 0.8
-            ),  # Low severity
-            self.create_test_insight("clarity_decline", "high", 0.6),  # Low confidence
-            self.create_test_insight(
-                "accuracy_issue", "critical", 0.9
-            ),  # Should be created
+            make_insight("performance_regression", "low", 0.8),  # Low severity
+            make_insight("clarity_decline", "high", 0.6),  # Low confidence
+            make_insight("accuracy_issue", "critical", 0.9),  # Should be created
         ]
 
         issue_urls = local_tracker.create_issues_from_insights(insights)
@@ -235,7 +207,7 @@ class TestIssueTracker:
                 }
                 mock_post.return_value = mock_response
 
-                insight = self.create_test_insight("performance_regression")
+                insight = make_insight("performance_regression")
                 template = self.issue_tracker._get_template_for_insight(insight)
                 issue_content = self.issue_tracker._generate_issue_content(
                     insight, template
@@ -270,7 +242,7 @@ class TestIssueTracker:
             mock_response.text = "Bad Request"
             mock_post.return_value = mock_response
 
-            insight = self.create_test_insight("performance_regression")
+            insight = make_insight("performance_regression")
             template = self.issue_tracker._get_template_for_insight(insight)
             issue_content = self.issue_tracker._generate_issue_content(
                 insight, template
@@ -296,7 +268,7 @@ class TestIssueTracker:
             }
             mock_post.return_value = mock_response
 
-            insight = self.create_test_insight("performance_regression")
+            insight = make_insight("performance_regression")
             template = self.issue_tracker._get_template_for_insight(insight)
             issue_content = self.issue_tracker._generate_issue_content(
                 insight, template
@@ -361,7 +333,7 @@ class TestIssueTracker:
         config = {}  # No credentials
         tracker = IssueTracker(config)
 
-        insight = self.create_test_insight("performance_regression")
+        insight = make_insight("performance_regression")
         template = tracker._get_template_for_insight(insight)
         issue_content = tracker._generate_issue_content(insight, template)
 
@@ -397,7 +369,7 @@ class TestIssueTracker:
     def test_error_handling(self):
         """Test error handling in issue creation."""
         # Test with invalid insight
-        insight = self.create_test_insight("invalid_type")
+        insight = make_insight("invalid_type")
         template = self.issue_tracker._get_template_for_insight(insight)
         issue_content = self.issue_tracker._generate_issue_content(insight, template)
 
@@ -407,7 +379,7 @@ class TestIssueTracker:
 
     def test_issue_content_with_metadata(self):
         """Test issue content generation with rich metadata."""
-        insight = self.create_test_insight("performance_regression", "critical", 0.9)
+        insight = make_insight("performance_regression", "critical", 0.9)
         insight.metadata = {
             "trend": "declining",
             "regression_percentage": 15.5,
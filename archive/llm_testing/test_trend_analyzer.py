@@ -1,8 +1,6 @@
 """Tests for the TrendAnalyzer module."""
 
 import pytest
-import tempfile
-import os
 from datetime import datetime, timedelta
 from unittest.mock import MagicMock
 from llm_testing.trend_analyzer import TrendAnalyzer, TrendPoint, TrendAnalysis
@@ -13,22 +11,15 @@ from llm_testing.types import EvaluationResult
 class TestTrendAnalyzer:
     """Test the TrendAnalyzer functionality."""
 
-    def setup_method(self):
+    @pytest.fixture(autouse=True)
+    def _setup(self, tmp_path):
         """Set up test fixtures."""
-        # Create a temporary database file
-        self.temp_dir = tempfile.mkdtemp()
-        self.db_path = os.path.join(self.temp_dir, "test_insights.db")
-        self.insights_db = InsightsDatabase(self.db_path)
+        # pytest removes tmp_path along with the database and any journal files
+        self.db_path = str(tmp_path / "test_insights.db")
+        self.insights_db = InsightsDatabase(self.db_path, fast=True)
         self.trend_analyzer = TrendAnalyzer(self.insights_db)
-
-    def teardown_method(self):
-        """Clean up test fixtures."""
-        # Remove the database file
-        if os.path.exists(self.db_path):
-            os.remove(self.db_path)
-        # Remove the temp directory
-        if os.path.exists(self.temp_dir):
-            os.rmdir(self.temp_dir)
+        yield
+        self.insights_db.close()
 
     def create_test_results(self, count: int = 5, trend: str = "stable") -> list:
         """Create test evaluation results with specified trend."""
@@ -22,6 +22,15 @@ class InProcessBackend:
             raise RuntimeError(f"FastAPI app not importable: {exc}")
         self.client = TestClient(app)
 
+    def close(self) -> None:
+        self.client.close()
+
+    def __enter__(self) -> "InProcessBackend":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
     def _setup_mock_db(self) -> None:
         """Set up mock database by patching the Supabase client."""
         from llm_testing.mock_db import get_mock_client, MockSupabaseClient
@@ -26,7 +26,8 @@ from typing import Any, Dict, List, Optional
 import json
 import os
 import re
-from datetime import datetime
+from datetime import datetime, timezone
+from functools import lru_cache
 from pathlib import Path
 
 try:  # Prefer shared client if present
@@ -37,6 +38,10 @@ try:
     from openai import OpenAI as _OpenAI  # type: ignore
 except ImportError:  # pragma: no cover - optional
     _OpenAI = None
+try:
+    import orjson  # type: ignore
+except ImportError:  # pragma: no cover - optional
+    orjson = None
 
 PRIORITY_VALUES = {"low", "medium", "high", "urgent"}
 TASK_STATUS_VALUES = {"backlog", "ready", "doing", "blocked", "done", "todo"}
@@ -47,6 +52,41 @@ ACTION_STATE_VALUES = {
     "dismissed",
     "converted_to_task",
 }
+_TRUE = frozenset({"1", "true", "yes", "on"})
+# Greedy on purpose: the grader reply nests {"scores": {...}} inside the object
+_JSON_OBJECT_RE = re.compile(r"\{[\s\S]*\}")
+
+
+@lru_cache(maxsize=None)
+def _offline_mode_for(offline_eval: Optional[str], has_api_key: bool) -> bool:
+    return (offline_eval or "false").lower() in _TRUE or not has_api_key
+
+
+def _offline_mode() -> bool:
+    """Return True when evaluation should skip the online agent evaluator.
+
+    Cached on the raw env values, so mutating the env yields a fresh result.
+    """
+    return _offline_mode_for(
+        os.environ.get("OFFLINE_EVAL"), bool(os.environ.get("LLM_EVAL_API_KEY"))
+    )
+
+
+def _ts() -> str:
+    return datetime.now(timezone.utc).isoformat(timespec="seconds")
+
+
+def _loads(txt: str) -> Any:
+    return orjson.loads(txt) if orjson is not None else json.loads(txt)
+
+
+def _write_json(path: Path, data: Any) -> None:
+    """Write indented JSON as a single buffer instead of per-token writes."""
+    if orjson is not None:
+        buf = orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    else:
+        buf = json.dumps(data, indent=2).encode()
+    path.write_bytes(buf)
 
 
 def _normalize_for_snapshot(obj: Any) -> Any:
@@ -114,8 +154,7 @@ def _compare_operation_snapshots(
     if not snapshot_file.exists():
         # First run - save snapshot
         snapshot_file.parent.mkdir(parents=True, exist_ok=True)
-        with open(snapshot_file, "w") as f:
-            json.dump(operation_responses, f, indent=2)
+        _write_json(snapshot_file, operation_responses)
         return {
             "match": True,
             "diff": None,
@@ -232,9 +271,7 @@ def _validate_deterministic_params(
     
     # Validate status values match user intent (only with live LLM, not fixtures)
     # With fixtures, operations are deterministic and may not match user message exactly
-    use_fixtures = os.getenv("LLM_TESTING_MODE", "false").lower() in {
-        "1", "true", "yes", "on"
-    }
+    use_fixtures = os.getenv("LLM_TESTING_MODE", "false").lower() in _TRUE
     if (
         not use_fixtures
         and op_type == "update_task_status"
@@ -379,8 +416,7 @@ def compare_snapshot(transcript: Dict[str, Any], snapshot_path: str) -> Dict[str
     if not snapshot_file.exists():
         # First run - save snapshot
         snapshot_file.parent.mkdir(parents=True, exist_ok=True)
-        with open(snapshot_file, "w") as f:
-            json.dump(normalized, f, indent=2)
+        _write_json(snapshot_file, normalized)
         return {
             "match": True,
             "diff": None,
@@ -420,18 +456,31 @@ def compare_snapshot(transcript: Dict[str, Any], snapshot_path: str) -> Dict[str
 def offline_eval(
     scenario: Dict[str, Any], transcript: Dict[str, Any]
 ) -> Dict[str, Any]:
-    text = json.dumps(transcript)
     exp = scenario.get("expectations", {})
-    must = exp.get("must_contain", [])
-    must_not = exp.get("must_not_contain", [])
+    must = [s for s in exp.get("must_contain", []) if s]
+    must_not = [s for s in exp.get("must_not_contain", []) if s]
+    function_calling = exp.get("function_calling", {})
+    if (
+        not must
+        and not must_not
+        and not scenario.get("snapshot")
+        and not function_calling.get("check_operations")
+    ):
+        # Nothing to check: skip serializing the transcript entirely
+        return {
+            "scores": {"factual": 1.0, "clarity": 1.0, "safety": 1.0},
+            "ok": True,
+            "rationale": "",
+        }
+    text = json.dumps(transcript) if must or must_not else ""
     ok = True
     reasons: List[str] = []
     for s in must:
-        if s and s not in text:
+        if s not in text:
             ok = False
             reasons.append(f"missing:{s}")
     for s in must_not:
-        if s and s in text:
+        if s in text:
             # Check if it's a false positive (e.g., "error" in "errors": [])
             # Only flag if it appears as a standalone word or in error messages
             if s == "error":
@@ -473,9 +522,7 @@ def offline_eval(
     snapshot_path = scenario.get("snapshot")
     if snapshot_path:
         snapshot_result = compare_snapshot(transcript, snapshot_path)
-        use_fixtures = os.getenv("LLM_TESTING_MODE", "false").lower() in {
-            "1", "true", "yes", "on"
-        }
+        use_fixtures = os.getenv("LLM_TESTING_MODE", "false").lower() in _TRUE
         if not snapshot_result["match"]:
             if use_fixtures:
                 # With fixtures, transcript should be deterministic (infrastructure testing)
@@ -490,7 +537,6 @@ def offline_eval(
                 )
 
     # Assess function calling if specified
-    function_calling = exp.get("function_calling", {})
     if function_calling.get("check_operations"):
         function_ok, function_reasons = _assess_function_calling(
             transcript, function_calling, scenario
@@ -510,9 +556,7 @@ def offline_eval(
                 )
                 # Only fail on snapshot mismatch when using fixtures (deterministic LLM)
                 # With live LLM calls, operation content varies but structure should match
-                use_fixtures = os.getenv("LLM_TESTING_MODE", "false").lower() in {
-                    "1", "true", "yes", "on"
-                }
+                use_fixtures = os.getenv("LLM_TESTING_MODE", "false").lower() in _TRUE
                 if not snapshot_result["match"]:
                     if use_fixtures:
                         # With fixtures, operations should be deterministic
@@ -534,11 +578,25 @@ def offline_eval(
     }
 
 
+def _load_transcript(rep: Dict[str, Any], report_path: str) -> Dict[str, Any]:
+    """Return the report's transcript with its steps in memory.
+
+    Current reports name a sibling ``.steps.jsonl`` log in ``steps_file``;
+    older ones embed the ``steps`` list directly.
+    """
+    transcript = rep.get("transcript") or {}
+    steps_file = transcript.pop("steps_file", None)
+    if steps_file is not None:
+        with open(Path(report_path).parent / steps_file, "r") as f:
+            transcript["steps"] = [json.loads(line) for line in f if line.strip()]
+    return transcript
+
+
 def evaluate(report_path: str) -> Dict[str, Any]:
     with open(report_path, "r") as f:
         rep = json.load(f)
     scenario = rep.get("scenario") or {}
-    transcript = rep.get("transcript") or {}
+    transcript = _load_transcript(rep, report_path)
 
     # Check snapshot if specified (optional - only for regression testing with fixtures)
     # Full transcript snapshots capture LLM-generated chat responses which are non-deterministic.
@@ -555,12 +613,7 @@ def evaluate(report_path: str) -> Dict[str, Any]:
     #
     # Agent evaluator is preferred when LLM_EVAL_API_KEY is available (for chat response quality).
     # Falls back to offline_eval (string matching) if agent evaluator unavailable or OFFLINE_EVAL=true.
-    if os.getenv("OFFLINE_EVAL", "false").lower() in {
-        "1",
-        "true",
-        "yes",
-        "on",
-    } or not os.getenv("LLM_EVAL_API_KEY"):
+    if _offline_mode():
         result = offline_eval(scenario, transcript)
         if snapshot_result:
             result["snapshot"] = snapshot_result
@@ -619,7 +672,7 @@ def evaluate(report_path: str) -> Dict[str, Any]:
                     "scenario": scenario,
                     "expectations": scenario.get("expectations", {}),
                     "transcript": transcript,
-                    "ts": datetime.utcnow().isoformat(),
+                    "ts": _ts(),
                 }
             ),
         }
@@ -629,14 +682,12 @@ def evaluate(report_path: str) -> Dict[str, Any]:
             temperature=0.0,
             max_tokens=300,
         )
-        txt = resp.choices[0].message.content or "{}"
+        txt = (resp.choices[0].message.content or "{}").strip()
         try:
-            data = json.loads(txt)
+            data = _loads(txt)
         except Exception:
             # Try to extract the first JSON object
-            import re as _re
-
-            m = _re.search(r"\{[\s\S]*\}", txt)
+            m = _JSON_OBJECT_RE.search(txt)
             data = json.loads(m.group(0)) if m else {}
         scores = data.get("scores") or {}
         if not scores:
@@ -646,9 +697,7 @@ def evaluate(report_path: str) -> Dict[str, Any]:
         factual_score = float(scores.get("factual", 0.0))
         ok = factual_score >= 1.0
         if snapshot_result and not snapshot_result.get("match", True):
-            use_fixtures = os.getenv("LLM_TESTING_MODE", "false").lower() in {
-                "1", "true", "yes", "on"
-            }
+            use_fixtures = os.getenv("LLM_TESTING_MODE", "false").lower() in _TRUE
             if use_fixtures:
                 # With fixtures, transcript should be deterministic (infrastructure testing)
                 ok = False
@@ -671,3 +720,10 @@ def evaluate(report_path: str) -> Dict[str, Any]:
         if snapshot_result:
             result["snapshot"] = snapshot_result
         return result
+
+
+__all__ = [
+    "compare_snapshot",
+    "evaluate",
+    "offline_eval",
+]
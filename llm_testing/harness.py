@@ -1,38 +1,282 @@
 from __future__ import annotations
-from typing import Any, Dict, List, Optional
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
+import contextlib
+import copy
+import io
+import itertools
 import json
+import multiprocessing.util
 import os
+import tempfile
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import lru_cache
 import time
 import uuid
 from pathlib import Path
 import yaml  # type: ignore
 import re
 
+try:  # libyaml-backed loader is much faster when PyYAML was built with it
+    from yaml import CSafeLoader as _YamlLoader  # type: ignore
+except ImportError:  # pragma: no cover - optional
+    from yaml import SafeLoader as _YamlLoader  # type: ignore
+
+try:
+    import orjson  # type: ignore
+except ImportError:  # pragma: no cover - optional
+    orjson = None
+
+from llm_testing.mock_db import get_mock_client, reset_mock_db
+
+_TRUE = frozenset({"1", "true", "yes", "on"})
+# InProcessBackend instances keyed on the flag env they were built under
+_BACKENDS: Dict[tuple, Any] = {}
+_BACKEND_ENV_KEYS = ("USE_MOCK_GRAPH", "DEV_MODE")
+# Run ids: one random prefix per process plus a counter, so ids stay unique
+# across processes without reading OS entropy for every scenario
+_RUN_PREFIX = ""
+_RUN_COUNTER = itertools.count()
+
+
+def _reset_run_ids() -> None:
+    global _RUN_PREFIX, _RUN_COUNTER
+    _RUN_PREFIX = uuid.uuid4().hex[:6]
+    _RUN_COUNTER = itertools.count()
+
+
+_reset_run_ids()
+# Forked pool workers would otherwise inherit the parent's prefix and count
+os.register_at_fork(after_in_child=_reset_run_ids)
+_LIVE_SCENARIOS = frozenset({"live_inbox", "live_send", "live_create_events"})
+
 
 def _is_true(v: str | None) -> bool:
-    return (v or "").strip().lower() in {"1", "true", "yes", "on"}
+    return v is not None and (v in _TRUE or v.strip().lower() in _TRUE)
 
 
-def load_yaml(path: str) -> Dict[str, Any]:
+@lru_cache(maxsize=256)
+def _parse_yaml(path: str, mtime_ns: int, size: int) -> Dict[str, Any]:
+    # mtime/size are part of the cache key so edited files are re-parsed
     with open(path, "r") as f:
-        return yaml.safe_load(f) or {}
+        return yaml.load(f, Loader=_YamlLoader) or {}
+
+
+def _load_yaml_cached(path: Union[str, Path]) -> Dict[str, Any]:
+    # str and Path callers share one cache entry per file
+    path = os.fspath(path)
+    st = os.stat(path)
+    return _parse_yaml(path, st.st_mtime_ns, st.st_size)
+
+
+def load_yaml(path: Union[str, Path]) -> Dict[str, Any]:
+    # run_scenario mutates the scenario, so callers always get their own copy
+    return copy.deepcopy(_load_yaml_cached(path))
+
+
+def prewarm(paths: Iterable[Union[str, Path]]) -> None:
+    """Parse scenario files up front so later load_yaml calls hit the cache."""
+    with ThreadPoolExecutor(max_workers=8) as ex:
+        list(ex.map(_load_yaml_cached, paths))
+
+
+def _dumps(obj: Any) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(obj, default=str)
+    return json.dumps(obj, default=str).encode()
+
+
+def _pattern_text(obj: Any) -> str:
+    """JSON text that contains patterns are matched against.
+
+    Keeps json.dumps' default ", "/": " separators and \\uXXXX escapes, which
+    scenario patterns are written for; reports use the compact _dumps form.
+    """
+    return json.dumps(obj, default=str)
+
+
+def _loads(buf: bytes) -> Any:
+    return orjson.loads(buf) if orjson is not None else json.loads(buf)
+
+
+def _parse_payload(response: Any) -> Any:
+    """Decode a JSON response body, or wrap the raw text when it is not JSON."""
+    content = response.content
+    if content and response.headers.get("content-type", "").startswith(
+        "application/json"
+    ):
+        try:
+            return _loads(content)
+        except ValueError:
+            pass
+    return {"text": response.text}
+
+
+class _StepLog:
+    """Append-only JSONL sink for transcript steps.
+
+    Steps are written as they happen and not kept in memory, so a partial
+    transcript survives a crashed scenario and the report stays small.
+    Scenario code only ever calls ``append``.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self._fp = open(path, "wb")
+
+    def append(self, step: Any) -> None:
+        self._fp.write(_dumps(step) + b"\n")
+        self._fp.flush()
+
+    def close(self) -> None:
+        self._fp.close()
+
+    def __enter__(self) -> "_StepLog":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
 
 
-def _assert_status(response: Any, expected: int) -> None:
+def _write_report(out_path: Path, data: Dict[str, Any]) -> None:
+    """Serialize a report and atomically move it into place."""
+    # Reports are machine-read; pretty-print only when asked to
+    pretty = _is_true(os.getenv("REPORT_PRETTY"))
+    if orjson is not None:
+        option = orjson.OPT_INDENT_2 if pretty else 0
+        buf = orjson.dumps(data, default=str, option=option)
+    else:
+        buf = json.dumps(data, default=str, indent=2 if pretty else None).encode()
+    fd, tmp = tempfile.mkstemp(dir=out_path.parent, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(buf)
+        os.replace(tmp, out_path)
+    except BaseException:
+        os.unlink(tmp)
+        raise
+
+
+def _assert_status(status: Optional[int], expected: int) -> None:
     """Assert HTTP response status code."""
-    status = getattr(response, "status_code", None)
     if status != expected:
         raise AssertionError(f"Expected status {expected}, got {status}")
 
 
+@lru_cache(maxsize=256)
+def _contains_pattern(needles: Tuple[str, ...]) -> "re.Pattern[str]":
+    # Longest first so a pattern is not hidden by one of its own prefixes
+    ordered = sorted(set(needles), key=len, reverse=True)
+    return re.compile("|".join(map(re.escape, ordered)))
+
+
 def _assert_contains(payload: Any, patterns: List[str]) -> None:
     """Assert that payload (as JSON string) contains all patterns."""
-    text = json.dumps(payload) if not isinstance(payload, str) else payload
-    missing = [p for p in patterns if p not in text]
+    text = _pattern_text(payload) if not isinstance(payload, str) else payload
+    needles = tuple(p for p in patterns if isinstance(p, str) and p)
+    found = (
+        {m.group(0) for m in _contains_pattern(needles).finditer(text)}
+        if needles
+        else set()
+    )
+    # Overlapping patterns can shadow each other in the scan, so confirm misses
+    missing = [p for p in patterns if p not in found and p not in text]
     if missing:
         raise AssertionError(f"Missing patterns: {missing}")
 
 
+# Compiled JSONPath: (parts, filter, field_parts). Each part is (key, index)
+# where index is the pre-parsed list index, or None when the key is not an
+# integer. ``filter`` is (field, value) for "[?(@.field == 'value')]"
+# selectors and None for plain dotted paths; field_parts are the parts after
+# the filter.
+_PathPart = Tuple[str, Optional[int]]
+_CompiledPath = Tuple[
+    Tuple[_PathPart, ...], Optional[Tuple[str, str]], Tuple[_PathPart, ...]
+]
+
+
+@lru_cache(maxsize=1024)
+def _tokenize(path: str) -> Tuple[_PathPart, ...]:
+    parts = []
+    for key in path.split("."):
+        try:
+            idx: Optional[int] = int(key)
+        except ValueError:
+            idx = None
+        parts.append((key, idx))
+    return tuple(parts)
+
+
+def _walk(current: Any, parts: Tuple[_PathPart, ...], strict: bool = False) -> Any:
+    """Follow tokenized parts through dicts/lists; None when any step misses.
+
+    With ``strict``, a step that cannot be taken at all (out of a scalar or a
+    missing value, or a non-integer key into a list) raises ValueError naming
+    the path up to that step; a missing leaf still comes back as None.
+    """
+    for i, (key, idx) in enumerate(parts):
+        if isinstance(current, dict):
+            current = current.get(key)
+        elif isinstance(current, list) and idx is not None:
+            current = current[idx] if idx < len(current) else None
+        elif strict:
+            walked = ".".join(k for k, _ in parts[: i + 1])
+            if isinstance(current, list):
+                raise ValueError(f"Invalid JSONPath: {walked}")
+            raise ValueError(f"Path not found: {walked}")
+        else:
+            return None
+        if current is None and not strict:
+            return None
+    return current
+
+
+def _match_filter(items: List[Any], flt: Tuple[str, str]) -> Optional[Dict[str, Any]]:
+    """First dict in ``items`` whose ``field`` equals ``value``, else None."""
+    field, value = flt
+    return next(
+        (item for item in items if isinstance(item, dict) and item.get(field) == value),
+        None,
+    )
+
+
+@lru_cache(maxsize=1024)
+def _compile_jsonpath(path: str) -> _CompiledPath:
+    """Tokenize a JSONPath once; raises ValueError for unsupported filters."""
+    if "[?(@" not in path:
+        return _tokenize(path), None, ()
+    # Extract array path, filter condition, and optional field access
+    array_path, rest = path.split("[?", 1)
+    filter_expr, field_path = rest.split("]", 1) if "]" in rest else (rest, "")
+    if field_path.startswith("."):
+        field_path = field_path[1:]  # Remove leading dot
+    # Parse filter like "@.op == 'create_task'"
+    if ".op ==" not in filter_expr:
+        raise ValueError(f"Unsupported filter expression: {filter_expr}")
+    op_value = (
+        filter_expr.split("'")[1] if "'" in filter_expr else filter_expr.split('"')[1]
+    )
+    field = filter_expr.split("@.")[1].split("==")[0].strip()
+    field_parts = _tokenize(field_path) if field_path else ()
+    return _tokenize(array_path), (field, op_value), field_parts
+
+
+def _split_filter(path: str) -> Tuple[str, str]:
+    """(array_path, filter_expr) as written in a filtered JSONPath, for errors."""
+    array_path, rest = path.split("[?", 1)
+    return array_path, "[?" + rest.split("]", 1)[0] + "]"
+
+
 def _assert_jsonpath(payload: Any, path: str, expected: Any) -> None:
     """Assert JSONPath expression matches expected value.
 
@@ -40,164 +284,181 @@ def _assert_jsonpath(payload: Any, path: str, expected: Any) -> None:
     - Simple paths: "pending.0.op"
     - Array filtering: "pending[?(@.op == 'create_task')].op" - finds first matching item's field
     """
-    # Handle array filtering syntax: "pending[?(@.op == 'create_task')].op"
-    if "[?(@" in path:
-        # Extract array path, filter condition, and optional field access
-        array_path, rest = path.split("[?", 1)
-        filter_expr, field_path = rest.split("]", 1) if "]" in rest else (rest, "")
-        if field_path.startswith("."):
-            field_path = field_path[1:]  # Remove leading dot
-
-        # Parse filter like "@.op == 'create_task'"
-        if ".op ==" in filter_expr:
-            op_value = (
-                filter_expr.split("'")[1]
-                if "'" in filter_expr
-                else filter_expr.split('"')[1]
-            )
-            field = filter_expr.split("@.")[1].split("==")[0].strip()
-
-            # Navigate to array
-            parts = array_path.split(".")
-            current = payload
-            for part in parts:
-                if isinstance(current, dict):
-                    current = current.get(part)
-                elif isinstance(current, list):
-                    try:
-                        idx = int(part)
-                        current = current[idx] if idx < len(current) else None
-                    except ValueError:
-                        current = None
-                else:
-                    current = None
-                if current is None:
-                    raise ValueError(f"Path not found: {array_path}")
-
-            # Find matching item in array
-            if not isinstance(current, list):
-                raise ValueError(f"Path {array_path} is not an array")
-
-            matching = next(
-                (
-                    item
-                    for item in current
-                    if isinstance(item, dict) and item.get(field) == op_value
-                ),
-                None,
-            )
-            if matching is None:
+    parts, flt, field_parts = _compile_jsonpath(path)
+    current = _walk(payload, parts, strict=True)
+    if flt is not None:
+        # Find matching item in array
+        if current is None:
+            raise ValueError(f"Path not found: {_split_filter(path)[0]}")
+        if not isinstance(current, list):
+            raise ValueError(f"Path {_split_filter(path)[0]} is not an array")
+
+        matching = _match_filter(current, flt)
+        if matching is None:
+            array_path, filter_expr = _split_filter(path)
+            raise ValueError(f"No item in {array_path} matching {filter_expr}")
+
+        # Access field if specified
+        if field_parts:
+            try:
+                current = _walk(matching, field_parts, strict=True)
+            except ValueError as exc:
+                array_path, filter_expr = _split_filter(path)
                 raise ValueError(
-                    f"No item found matching {filter_expr} in {array_path}"
-                )
-
-            # Access field if specified
-            if field_path:
-                parts = field_path.split(".")
-                current = matching
-                for part in parts:
-                    if isinstance(current, dict):
-                        current = current.get(part)
-                    else:
-                        raise ValueError(f"Path not found: {path}")
-                if current != expected:
-                    raise AssertionError(
-                        f"JSONPath {path}: expected {expected}, got {current}"
-                    )
-            else:
-                # Just checking that matching item exists
-                if expected and not matching:
-                    raise AssertionError(
-                        f"JSONPath {path}: expected matching item, got None"
-                    )
+                    f"{exc} in item of {array_path} matching {filter_expr}"
+                ) from None
         else:
-            raise ValueError(f"Unsupported filter expression: {filter_expr}")
-        return
+            # Just checking that matching item exists
+            if expected and not matching:
+                raise AssertionError(
+                    f"JSONPath {path}: expected matching item, got None"
+                )
+            return
 
-    # Standard JSONPath extraction
-    parts = path.split(".")
-    current = payload
-    for part in parts:
-        if isinstance(current, dict):
-            current = current.get(part)
-        elif isinstance(current, list):
-            try:
-                idx = int(part)
-                current = current[idx] if idx < len(current) else None
-            except ValueError:
-                raise ValueError(f"Invalid JSONPath: {path}")
-        else:
-            raise ValueError(f"Path not found: {path}")
     if current != expected:
         raise AssertionError(f"JSONPath {path}: expected {expected}, got {current}")
 
 
-def _apply_env_vars(env: Dict[str, Any]) -> None:
-    """Apply environment variables from scenario."""
-    for key, value in env.items():
-        os.environ[key] = str(value)
+@lru_cache(maxsize=128)
+def _var_pattern(names: Tuple[str, ...]) -> "re.Pattern[str]":
+    """Single alternation matching any ``<name>`` placeholder in one scan."""
+    return re.compile("<(" + "|".join(map(re.escape, names)) + ")>")
+
+
+@contextlib.contextmanager
+def _feature_flags(**flags: str) -> Iterator[None]:
+    """Set env flags for the duration of the block, restoring prior values."""
+    old = {k: os.environ.get(k) for k in flags}
+    os.environ.update(flags)
+    try:
+        yield
+    finally:
+        for k, v in old.items():
+            if v is None:
+                os.environ.pop(k, None)
+            else:
+                os.environ[k] = v
+
+
+def _next_run_id() -> str:
+    return f"{_RUN_PREFIX}{next(_RUN_COUNTER):02x}"
+
+
+def _make_run_dir(path: Path) -> None:
+    # One mkdir in the common case; parents are only created on first use
+    try:
+        path.mkdir()
+    except FileNotFoundError:
+        path.mkdir(parents=True, exist_ok=True)
+    except FileExistsError:
+        pass
 
 
-def run_scenario(scn_path: str) -> Dict[str, Any]:
+def _backend_key() -> tuple:
+    return tuple(
+        sorted(
+            (k, v)
+            for k, v in os.environ.items()
+            if k.startswith("FEATURE_") or k in _BACKEND_ENV_KEYS
+        )
+    )
+
+
+def _get_backend() -> Any:
+    """Return a cached InProcessBackend for the current feature-flag env."""
+    key = _backend_key()
+    backend = _BACKENDS.get(key)
+    if backend is None:
+        # Imported on first use: env must be prepared before the FastAPI app
+        # initializes, and the harness stays importable without fastapi
+        from llm_testing.backends.inprocess import InProcessBackend  # type: ignore
+
+        backend = _BACKENDS[key] = InProcessBackend()
+    return backend
+
+
+def close_backends() -> None:
+    """Close and forget every cached backend (and its HTTP client)."""
+    while _BACKENDS:
+        _, backend = _BACKENDS.popitem()
+        backend.close()
+
+
+def run_scenario(scn_path: Union[str, Path]) -> Dict[str, Any]:
     os.environ["USE_MOCK_GRAPH"] = "true"
     os.environ.setdefault("DEV_MODE", "true")
     scn = load_yaml(scn_path)
-    run_id = uuid.uuid4().hex[:8]
+    run_id = _next_run_id()
     name = scn.get("name") or Path(scn_path).stem
 
-    # Apply scenario-specific env vars first (so they can override defaults)
-    if "env" in scn:
-        _apply_env_vars(scn["env"])
-
-    # Enable LLM_TESTING_MODE by default, but allow scenarios to opt-out
-    # Priority: env var > scenario use_llm_fixtures > default (true)
-    # Set LLM_TESTING_MODE=false in env or use_llm_fixtures: false to test actual LLM behavior
-    if os.getenv("LLM_TESTING_MODE") is not None:
-        # Environment variable takes precedence (e.g., from Makefile or CI)
-        pass  # Already set, don't override
-    elif "use_llm_fixtures" in scn:
-        # Explicit scenario-level control
-        if scn["use_llm_fixtures"] is False:
-            os.environ["LLM_TESTING_MODE"] = "false"
+    # Scenario-specific env vars are scoped to this run so they cannot leak
+    # into later scenarios (or the backend cache key)
+    scenario_env = {k: str(v) for k, v in (scn.get("env") or {}).items()}
+    # For live_* scenarios, set flags before creating the backend so routes see them at import time
+    # Per-action flags are scoped below per scenario
+    if name in _LIVE_SCENARIOS:
+        scenario_env["FEATURE_GRAPH_LIVE"] = "true"
+
+    with _feature_flags(**scenario_env):
+        # Enable LLM_TESTING_MODE by default, but allow scenarios to opt-out
+        # Priority: env var > scenario use_llm_fixtures > default (true)
+        # Set LLM_TESTING_MODE=false in env or use_llm_fixtures: false to test actual LLM behavior
+        if os.getenv("LLM_TESTING_MODE") is not None:
+            # Environment variable takes precedence (e.g., from Makefile or CI)
+            pass  # Already set, don't override
+        elif "use_llm_fixtures" in scn:
+            # Explicit scenario-level control
+            if scn["use_llm_fixtures"] is False:
+                os.environ["LLM_TESTING_MODE"] = "false"
+            else:
+                os.environ.setdefault("LLM_TESTING_MODE", "true")
         else:
+            # Default to fixtures if not explicitly set
             os.environ.setdefault("LLM_TESTING_MODE", "true")
-    else:
-        # Default to fixtures if not explicitly set
-        os.environ.setdefault("LLM_TESTING_MODE", "true")
 
-    # For live_* scenarios, set flags before creating the backend so routes see them at import time
-    if name in {"live_inbox", "live_send", "live_create_events"}:
-        os.environ["FEATURE_GRAPH_LIVE"] = "true"
-        # Per-action flags toggled below per scenario
+        out_path = _execute_scenario(scn, name, run_id)
+    return {"run_id": run_id, "report": str(out_path)}
 
-    # Import after env is prepared so FastAPI app can initialize in dev mode
-    from llm_testing.backends.inprocess import InProcessBackend  # type: ignore
-    from llm_testing.mock_db import get_mock_client, reset_mock_db
 
-    backend = InProcessBackend()
+def _execute_scenario(scn: Dict[str, Any], name: str, run_id: str) -> Path:
+    backend = _get_backend()
 
     # Always use mock database for tests (independent of LLM_TESTING_MODE)
     # LLM_TESTING_MODE controls whether we use LLM fixtures or live calls
     # Mock DB ensures we don't hit real Supabase during testing
     reset_mock_db()
-    mock_db = get_mock_client()
+    get_mock_client()
 
-    # Seed database if scenario needs it
-    if "seed_workroom" in str(scn.get("steps", [])):
-        # Will be seeded via /dev/workroom/seed endpoint
-        pass
-    if "seed_queue" in str(scn.get("steps", [])):
-        # Will be seeded via /dev/queue/seed endpoint
-        pass
+    # Scenarios that need data seed it themselves via the /dev/workroom/seed
+    # and /dev/queue/seed endpoints in their steps
 
     reports_dir = Path("llm_testing") / "reports" / run_id
-    reports_dir.mkdir(parents=True, exist_ok=True)
-    transcript: Dict[str, Any] = {"scenario": name, "steps": []}
+    _make_run_dir(reports_dir)
+    # Closed even when a step assertion fails mid-scenario
+    with _StepLog(reports_dir / f"{name}.steps.jsonl") as step_log:
+        transcript: Dict[str, Any] = {"scenario": name, "steps": step_log}
+        _run_scenario_steps(scn, name, backend, transcript)
+
+    # The report points at the step log instead of embedding the steps;
+    # evaluator.evaluate reads them back from it
+    del transcript["steps"]
+    transcript["steps_file"] = step_log.path.name
+    out_path = reports_dir / f"{name}.json"
+    _write_report(
+        out_path, {"scenario": scn, "transcript": transcript, "ts": time.time()}
+    )
+    return out_path
 
+
+def _run_scenario_steps(
+    scn: Dict[str, Any], name: str, backend: Any, transcript: Dict[str, Any]
+) -> None:
+    """Execute a scenario's steps, recording each one in ``transcript``."""
     # If scenario defines explicit steps, execute them generically
     if scn.get("steps"):
         expectations: Dict[str, Any] = scn.get("expectations") or {}
-        text_chunks: list[str] = []
+        text_buf = io.StringIO()  # newline-joined str(payload) of each step
+        text_sep = ""
         variables: Dict[str, Any] = {}  # Store extracted variables for substitution
         raw_variables: Dict[str, Any] = {}
 
@@ -209,88 +470,54 @@ def run_scenario(scn_path: str) -> Dict[str, Any]:
             - Array filtering: "pending[?(@.op == 'create_task')]" - finds first matching item
             """
             for var_name, jsonpath in extract.items():
+                try:
+                    parts, flt, _ = _compile_jsonpath(jsonpath)
+                except ValueError:
+                    continue
                 # Handle array filtering syntax: "pending[?(@.op == 'create_task')]"
-                if "[?(@" in jsonpath:
-                    # Extract array path and filter condition
-                    array_path, filter_expr = jsonpath.split("[?", 1)
-                    filter_expr = filter_expr.rstrip("]")
-
-                    # Parse filter like "@.op == 'create_task'"
-                    if ".op ==" in filter_expr:
-                        op_value = (
-                            filter_expr.split("'")[1]
-                            if "'" in filter_expr
-                            else filter_expr.split('"')[1]
-                        )
-                        field = filter_expr.split("@.")[1].split("==")[0].strip()
-
-                        # Navigate to array
-                        parts = array_path.split(".")
-                        current = payload
-                        for part in parts:
-                            if isinstance(current, dict):
-                                current = current.get(part)
-                            elif isinstance(current, list):
-                                try:
-                                    idx = int(part)
-                                    current = (
-                                        current[idx] if idx < len(current) else None
-                                    )
-                                except ValueError:
-                                    current = None
-                            else:
-                                current = None
-                            if current is None:
-                                break
-
-                        # Find matching item in array
-                        if isinstance(current, list):
-                            matching = next(
-                                (
-                                    item
-                                    for item in current
-                                    if isinstance(item, dict)
-                                    and item.get(field) == op_value
-                                ),
-                                None,
-                            )
-                            if matching is not None:
-                                variables[var_name] = json.dumps(matching)
-                                raw_variables[var_name] = matching
+                if flt is not None:
+                    # Navigate to array
+                    current = _walk(payload, parts)
+
+                    # Find matching item in array
+                    if isinstance(current, list):
+                        matching = _match_filter(current, flt)
+                        if matching is not None:
+                            variables[var_name] = _pattern_text(matching)
+                            raw_variables[var_name] = matching
                     continue
 
                 # Standard JSONPath extraction
-                parts = jsonpath.split(".")
-                current = payload
-                for part in parts:
-                    if isinstance(current, dict):
-                        current = current.get(part)
-                    elif isinstance(current, list):
-                        try:
-                            idx = int(part)
-                            current = current[idx] if idx < len(current) else None
-                        except ValueError:
-                            current = None
-                    else:
-                        current = None
-                    if current is None:
-                        break
+                current = _walk(payload, parts)
                 if current is not None:
                     variables[var_name] = str(current)
                     raw_variables[var_name] = current
 
+        def _append_text(payload: Any) -> None:
+            nonlocal text_sep
+            text_buf.write(text_sep)
+            text_buf.write(str(payload))
+            text_sep = "\n"
+
         def _substitute_vars(text: str) -> str:
             """Substitute variables in text."""
-            for var_name, var_value in variables.items():
-                text = text.replace(f"<{var_name}>", var_value)
-            return text
+            if not variables or "<" not in text:
+                return text
+            return _var_pattern(tuple(variables)).sub(
+                lambda m: variables[m.group(1)], text
+            )
 
         def _resolve_body_vars(obj: Any) -> Any:
+            """Substitute <var> text and resolve {"__var__": name} in one pass."""
+            if isinstance(obj, str):
+                return _substitute_vars(obj)
             if isinstance(obj, dict):
                 if "__var__" in obj and len(obj) == 1:
-                    var_name = obj["__var__"]
+                    var_name = _resolve_body_vars(obj["__var__"])
                     return raw_variables.get(var_name)
-                return {k: _resolve_body_vars(v) for k, v in obj.items()}
+                return {
+                    _resolve_body_vars(k): _resolve_body_vars(v) for k, v in obj.items()
+                }
             if isinstance(obj, list):
                 return [_resolve_body_vars(item) for item in obj]
             return obj
@@ -325,14 +552,11 @@ def run_scenario(scn_path: str) -> Dict[str, Any]:
             if act == "reset_state":
                 # Reset in-memory state
                 r = backend.client.post("/dev/state/reset")
-                try:
-                    payload = r.json()
-                except Exception:
-                    payload = {"text": r.text}
+                payload = _parse_payload(r)
                 transcript["steps"].append(
                     {"action": "reset_state", "response": payload}
                 )
-                text_chunks.append(str(payload))
+                _append_text(payload)
             elif act == "http":
                 method = (step.get("method") or "GET").upper()
                 url = step.get("url") or "/"
@@ -349,9 +573,6 @@ def run_scenario(scn_path: str) -> Dict[str, Any]:
                 body = step["json"] if "json" in step else step.get("body")
                 # Substitute variables in body (recursively)
                 if body:
-                    body_str = json.dumps(body)
-                    body_str = _substitute_vars(body_str)
-                    body = json.loads(body_str)
                     body = _resolve_body_vars(body)
 
                 if method == "GET":
@@ -364,10 +585,8 @@ def run_scenario(scn_path: str) -> Dict[str, Any]:
                     r = backend.client.delete(url, params=params)
                 else:
                     r = backend.client.request(method, url, params=params, json=body)
-                try:
-                    payload = r.json()
-                except Exception:
-                    payload = {"text": r.text}
+                status = r.status_code
+                payload = _parse_payload(r)
 
                 # Extract variables if specified
                 if "extract" in step:
@@ -376,7 +595,7 @@ def run_scenario(scn_path: str) -> Dict[str, Any]:
                 # Step-level assertions
                 expect = _substitute_expectations(step.get("expect", {}))
                 if "status" in expect:
-                    _assert_status(r, expect["status"])
+                    _assert_status(status, expect["status"])
                 if "contains" in expect:
                     _assert_contains(payload, expect["contains"])
                 if "jsonpath" in expect:
@@ -387,24 +606,7 @@ def run_scenario(scn_path: str) -> Dict[str, Any]:
                             or expected == "<operations>"
                         ):
                             # Just verify path exists, don't assert value
-                            parts = path.split(".")
-                            current = payload
-                            for part in parts:
-                                if isinstance(current, dict):
-                                    current = current.get(part)
-                                elif isinstance(current, list):
-                                    try:
-                                        idx = int(part)
-                                        current = (
-                                            current[idx] if idx < len(current) else None
-                                        )
-                                    except ValueError:
-                                        current = None
-                                else:
-                                    current = None
-                                if current is None:
-                                    break
-                            if current is None:
+                            if _walk(payload, _tokenize(path)) is None:
                                 raise AssertionError(f"JSONPath {path} not found")
                         else:
                             _assert_jsonpath(payload, path, expected)
@@ -413,13 +615,13 @@ def run_scenario(scn_path: str) -> Dict[str, Any]:
                     "endpoint": url,
                     "method": method,
                     "response": payload,
-                    "status": getattr(r, "status_code", None),
+                    "status": status,
                 }
                 # Include request body for deterministic parameter validation
                 if body:
                     step_data["request_body"] = body
                 transcript["steps"].append(step_data)
-                text_chunks.append(str(payload))
+                _append_text(payload)
             elif act == "grade":
                 rubric = step.get("rubric") or {}
                 must = rubric.get("must_include") or []
@@ -435,79 +637,148 @@ def run_scenario(scn_path: str) -> Dict[str, Any]:
         if expectations:
             scn["expectations"] = expectations
         # minimal concatenated text for simple grep evaluators
-        transcript["text"] = "\n".join(text_chunks)
+        transcript["text"] = text_buf.getvalue()
     else:
         # Apply fixtures is implicit via mock providers reading from llm_testing/fixtures
         # Execute primary action per scenario by name
-        if name == "plan_today":
-            resp = backend.calendar_plan_today()
-            transcript["steps"].append(
-                {"endpoint": "/calendar/plan-today", "response": resp}
-            )
-        elif name == "approve_send":
-            d = backend.email_create_draft(["user@example.com"], "Hello", "Body")
-            transcript["steps"].append({"endpoint": "/email/drafts", "response": d})
-            s = backend.email_send(d.get("id"))
-            transcript["steps"].append({"endpoint": "/email/send/{id}", "response": s})
-        elif name == "triage_inbox":
-            resp = backend.actions_scan(["email"])
-            transcript["steps"].append({"endpoint": "/actions/scan", "response": resp})
-        elif name == "undo_event":
-            # Minimal: create then undo by approvals flow placeholder
-            p = backend.calendar_plan_today()
-            transcript["steps"].append(
-                {"endpoint": "/calendar/plan-today", "response": p}
-            )
-        elif name == "token_expired_reconnect":
-            # Simulate via expectations in evaluator fallback; mocks won't 401
-            resp = backend.actions_scan(["email"])
-            transcript["steps"].append({"endpoint": "/actions/scan", "response": resp})
-        elif name == "live_inbox":
-            os.environ["FEATURE_LIVE_LIST_INBOX"] = "true"
-            r = backend.client.get(
-                "/actions/live/inbox", params={"user_id": "default", "limit": 5}
-            )
-            transcript["steps"].append(
-                {"endpoint": "/actions/live/inbox", "response": r.json()}
-            )
-        elif name == "live_send":
-            os.environ["FEATURE_LIVE_SEND_MAIL"] = "true"
-            r = backend.client.post(
-                "/actions/live/send",
-                params={"user_id": "default"},
-                json={
-                    "to": ["user@example.com"],
-                    "subject": "[YGT Test]",
-                    "body": "Hi",
-                },
-            )
-            transcript["steps"].append(
-                {"endpoint": "/actions/live/send", "response": r.json()}
-            )
-        elif name == "live_create_events":
-            os.environ["FEATURE_LIVE_CREATE_EVENTS"] = "true"
-            ev = {
-                "title": "Block",
-                "start": "2025-10-25T09:00:00Z",
-                "end": "2025-10-25T09:30:00Z",
-            }
-            r = backend.client.post(
-                "/actions/live/create-events",
-                params={"user_id": "default"},
-                json={"events": [ev]},
-            )
-            transcript["steps"].append(
-                {"endpoint": "/actions/live/create-events", "response": r.json()}
-            )
-        else:
-            # default: just run scan
-            resp = backend.actions_scan([])
-            transcript["steps"].append({"endpoint": "/actions/scan", "response": resp})
+        _SCENARIOS.get(name, _do_default)(backend, transcript)
     # (legacy block removed; scenarios are executed only once)
 
-    out_path = reports_dir / f"{name}.json"
-    with open(out_path, "w") as f:
-        json.dump(
-            {"scenario": scn, "transcript": transcript, "ts": time.time()}, f, indent=2
+
+def _do_plan_today(backend: Any, transcript: Dict[str, Any]) -> None:
+    resp = backend.calendar_plan_today()
+    transcript["steps"].append({"endpoint": "/calendar/plan-today", "response": resp})
+
+
+def _do_approve_send(backend: Any, transcript: Dict[str, Any]) -> None:
+    d = backend.email_create_draft(["user@example.com"], "Hello", "Body")
+    transcript["steps"].append({"endpoint": "/email/drafts", "response": d})
+    s = backend.email_send(d.get("id"))
+    transcript["steps"].append({"endpoint": "/email/send/{id}", "response": s})
+
+
+def _do_triage_inbox(backend: Any, transcript: Dict[str, Any]) -> None:
+    resp = backend.actions_scan(["email"])
+    transcript["steps"].append({"endpoint": "/actions/scan", "response": resp})
+
+
+def _do_undo_event(backend: Any, transcript: Dict[str, Any]) -> None:
+    # Minimal: create then undo by approvals flow placeholder
+    p = backend.calendar_plan_today()
+    transcript["steps"].append({"endpoint": "/calendar/plan-today", "response": p})
+
+
+def _do_token_expired_reconnect(backend: Any, transcript: Dict[str, Any]) -> None:
+    # Simulate via expectations in evaluator fallback; mocks won't 401
+    resp = backend.actions_scan(["email"])
+    transcript["steps"].append({"endpoint": "/actions/scan", "response": resp})
+
+
+def _do_live_inbox(backend: Any, transcript: Dict[str, Any]) -> None:
+    with _feature_flags(FEATURE_LIVE_LIST_INBOX="true"):
+        r = backend.client.get(
+            "/actions/live/inbox", params={"user_id": "default", "limit": 5}
         )
-    return {"run_id": run_id, "report": str(out_path)}
+        transcript["steps"].append(
+            {"endpoint": "/actions/live/inbox", "response": r.json()}
+        )
+
+
+def _do_live_send(backend: Any, transcript: Dict[str, Any]) -> None:
+    with _feature_flags(FEATURE_LIVE_SEND_MAIL="true"):
+        r = backend.client.post(
+            "/actions/live/send",
+            params={"user_id": "default"},
+            json={
+                "to": ["user@example.com"],
+                "subject": "[YGT Test]",
+                "body": "Hi",
+            },
+        )
+        transcript["steps"].append(
+            {"endpoint": "/actions/live/send", "response": r.json()}
+        )
+
+
+def _do_live_create_events(backend: Any, transcript: Dict[str, Any]) -> None:
+    with _feature_flags(FEATURE_LIVE_CREATE_EVENTS="true"):
+        ev = {
+            "title": "Block",
+            "start": "2025-10-25T09:00:00Z",
+            "end": "2025-10-25T09:30:00Z",
+        }
+        r = backend.client.post(
+            "/actions/live/create-events",
+            params={"user_id": "default"},
+            json={"events": [ev]},
+        )
+        transcript["steps"].append(
+            {"endpoint": "/actions/live/create-events", "response": r.json()}
+        )
+
+
+def _do_default(backend: Any, transcript: Dict[str, Any]) -> None:
+    # default: just run scan
+    resp = backend.actions_scan([])
+    transcript["steps"].append({"endpoint": "/actions/scan", "response": resp})
+
+
+# Built-in scenarios without explicit steps, dispatched by scenario name
+_SCENARIOS: Dict[str, Callable[[Any, Dict[str, Any]], None]] = {
+    "plan_today": _do_plan_today,
+    "approve_send": _do_approve_send,
+    "triage_inbox": _do_triage_inbox,
+    "undo_event": _do_undo_event,
+    "token_expired_reconnect": _do_token_expired_reconnect,
+    "live_inbox": _do_live_inbox,
+    "live_send": _do_live_send,
+    "live_create_events": _do_live_create_events,
+}
+
+
+def init_worker(base_dir: str) -> None:
+    """Pool initializer giving each worker process its own app state dir.
+
+    The app keeps approvals and history in SQLite under DATA_DIR; workers
+    sharing it would clear each other's state mid-scenario.
+    """
+    data_dir = os.path.join(base_dir, str(os.getpid()))
+    os.makedirs(data_dir, exist_ok=True)
+    os.environ["DATA_DIR"] = data_dir
+    os.environ["DATA_STORE_PATH"] = os.path.join(data_dir, "lucidwork.db")
+    # Pool workers leave through multiprocessing's exit hook, not atexit
+    multiprocessing.util.Finalize(None, close_backends, exitpriority=0)
+
+
+def run_scenarios(
+    paths: List[Union[str, Path]], workers: Optional[int] = None
+) -> List[Dict[str, Any]]:
+    """Run scenarios in parallel, one worker process per core by default.
+
+    Each worker owns its env, backend and app state, so scenarios cannot leak
+    into one another. Results are returned in the order of ``paths``. With a
+    single worker (or path) the scenarios run in this process instead.
+    """
+    workers = workers or os.cpu_count() or 1
+    if workers == 1 or len(paths) <= 1:
+        try:
+            return [run_scenario(p) for p in paths]
+        finally:
+            close_backends()
+    with tempfile.TemporaryDirectory(prefix="llm_testing_") as base:
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=init_worker,
+            initargs=(base,),
+        ) as ex:
+            return list(ex.map(run_scenario, paths))
+
+
+__all__ = [
+    "close_backends",
+    "init_worker",
+    "load_yaml",
+    "prewarm",
+    "run_scenario",
+    "run_scenarios",
+]
@@ -1,22 +1,52 @@
 from __future__ import annotations
-from typing import Any, Dict, List
+from typing import Any, Dict, Optional
 import json
 import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+import numpy as np
+
+try:
+    import orjson  # type: ignore
+except ImportError:  # pragma: no cover - optional
+    orjson = None
+
+
+def _load(p: Path) -> Any:
+    buf = p.read_bytes()
+    return orjson.loads(buf) if orjson is not None else json.loads(buf)
+
+
+def summarize(run_dir: str, md_out: Optional[str] = None) -> Dict[str, Any]:
+    """Average the graded scores in run_dir, optionally writing the markdown
+    report (see reporters.write_markdown) from the same pass over the files."""
+    paths = sorted(Path(run_dir).glob("*.graded.json"))
+    per_file = np.empty(len(paths), dtype=np.float64)
+    out = open(md_out, "w") if md_out else None
+    try:
+        if out:
+            out.write("# LLM Evals Report\n")
+        # Reads are I/O-bound, so overlap them; map still yields in path order
+        with ThreadPoolExecutor(max_workers=16) as ex:
+            for i, (p, data) in enumerate(zip(paths, ex.map(_load, paths))):
+                s = data.get("evaluation", {}).get("scores", {})
+                # average; a file without scores counts as 0.0
+                vals = np.fromiter((float(v) for v in s.values()), dtype=np.float64)
+                per_file[i] = vals.mean() if vals.size else 0.0
+                if out:
+                    name = p.stem.replace(".graded", "")
+                    # Entries are separated by a blank line
+                    out.write(f"\n- {name}: {s}\n")
+    finally:
+        if out:
+            out.close()
+    avg = float(per_file.mean()) if per_file.size else 0.0
+    return {"avg": avg, "count": int(per_file.size)}
+
 
 def aggregate(run_dir: str) -> Dict[str, Any]:
-    d = Path(run_dir)
-    scores: List[float] = []
-    for p in d.glob("*.graded.json"):
-        with open(p, "r") as f:
-            data = json.load(f)
-        s = data.get("evaluation", {}).get("scores", {})
-        # average
-        vals = [float(v) for v in s.values()] or [0.0]
-        scores.append(sum(vals) / len(vals))
-    avg = sum(scores) / len(scores) if scores else 0.0
-    return {"avg": avg, "count": len(scores)}
+    return summarize(run_dir)
 
 
 def gate(avg: float, threshold: float) -> int:
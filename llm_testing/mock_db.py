@@ -4,7 +4,7 @@ Provides in-memory storage that mimics Supabase behavior for testing.
 """
 
 from __future__ import annotations
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Set
 import uuid
 from datetime import datetime, timezone
 
@@ -13,43 +13,116 @@ class MockSupabaseClient:
     """In-memory mock of Supabase REST API client."""
 
     def __init__(self):
-        self._tables: Dict[str, List[Dict[str, Any]]] = {
-            "users": [],
-            "projects": [],
-            "tasks": [],
-            "threads": [],
-            "messages": [],
-            "action_items": [],
-            "task_action_links": [],
-            "task_sources": [],
+        # Rows keyed by id; dicts keep insertion order, which is table order
+        self._tables: Dict[str, Dict[Any, Dict[str, Any]]] = {
+            "users": {},
+            "projects": {},
+            "tasks": {},
+            "threads": {},
+            "messages": {},
+            "action_items": {},
+            "task_action_links": {},
+            "task_sources": {},
         }
         self._next_id = 1
+        # Insertion sequence per row, so index hits can be returned in table
+        # order without scanning the table.
+        self._seq: Dict[str, Dict[Any, int]] = {t: {} for t in self._tables}
+        self._next_seq = 0
+        # Lazily built eq-filter indexes: table -> column -> str(value) -> ids
+        self._indexes: Dict[str, Dict[str, Dict[str, Set[Any]]]] = {
+            t: {} for t in self._tables
+        }
         self._seed_default_user()
 
+    def rows(self, table: str) -> List[Dict[str, Any]]:
+        """All rows of a table, in insertion order."""
+        return list(self._tables.get(table, {}).values())
+
+    def _insert(self, table: str, row: Dict[str, Any]) -> None:
+        """Append a row to a table and register it with the indexes.
+
+        Raises ValueError if the table already holds a row with this id.
+        """
+        rows = self._tables[table]
+        row_id = row.get("id")
+        if row_id in rows:
+            raise ValueError(f"duplicate id {row_id!r} in {table}")
+        rows[row_id] = row
+        self._seq[table][row_id] = self._next_seq
+        self._next_seq += 1
+        self._reindex(table, row)
+
+    def _unindex(self, table: str, row: Dict[str, Any]) -> None:
+        row_id = row.get("id")
+        for col, index in self._indexes[table].items():
+            ids = index.get(str(row.get(col)))
+            if ids is not None:
+                ids.discard(row_id)
+
+    def _reindex(self, table: str, row: Dict[str, Any]) -> None:
+        row_id = row.get("id")
+        for col, index in self._indexes[table].items():
+            index.setdefault(str(row.get(col)), set()).add(row_id)
+
+    def _index(self, table: str, col: str) -> Dict[str, Set[Any]]:
+        """Return the index for a column, building it on first use."""
+        index = self._indexes[table].get(col)
+        if index is None:
+            index = {}
+            for row_id, row in self._tables[table].items():
+                index.setdefault(str(row.get(col)), set()).add(row_id)
+            self._indexes[table][col] = index
+        return index
+
+    def _lookup(self, table: str, eq: Dict[str, str]) -> List[Dict[str, Any]]:
+        """Rows matching every ``col == val`` pair, in table order."""
+        sets = [self._index(table, col).get(val, set()) for col, val in eq.items()]
+        ids = set.intersection(*sets) if len(sets) > 1 else sets[0]
+        order = self._seq[table]
+        rows = self._tables[table]
+        return [
+            rows[i]
+            for i in sorted(ids, key=order.__getitem__)
+            # Re-check in case a caller mutated a returned row in place
+            if all(str(rows[i].get(col)) == val for col, val in eq.items())
+        ]
+
     def _seed_default_user(self):
         """Seed a default user for testing."""
+        now = datetime.now(timezone.utc).isoformat()
         default_user = {
             "id": "ea7f6212-c420-4be5-84e3-c34257b4fa99",
             "tenant_id": "6b58b8eb-70a0-4efd-8354-c5cf0862d983",
             "email": "test.user+local@example.com",
             "name": "Test User",
-            "created_at": datetime.now(timezone.utc).isoformat(),
-            "updated_at": datetime.now(timezone.utc).isoformat(),
+            "created_at": now,
+            "updated_at": now,
         }
-        self._tables["users"].append(default_user)
+        self._insert("users", default_user)
 
     def get(self, path: str, params: Optional[Dict[str, Any]] = None) -> MockResponse:
         """Mock GET request."""
         table = path.lstrip("/")
         filters = params or {}
 
-        # Get all rows for table
-        rows = self._tables.get(table, [])
+        # Get all rows for table, narrowed through the indexes by any eq
+        # filters that come before a limit (limit is applied in param order)
+        rows = list(self._tables.get(table, {}).values())
+        eq: Dict[str, str] = {}
+        if table in self._indexes:
+            for key, value in filters.items():
+                if key == "limit":
+                    break
+                if key not in ("select", "order") and str(value).startswith("eq."):
+                    eq[key] = str(value)[3:]
+        if eq:
+            rows = self._lookup(table, eq)
 
         # Apply filters
         limit_applied = False
         for key, value in filters.items():
-            if key == "select":
+            if key == "select" or key in eq:
                 continue  # Ignore select for now
             if key == "order":
                 # Simple ordering - just reverse if desc
@@ -98,12 +171,21 @@ class MockSupabaseClient:
         # Generate ID if not provided
         if "id" not in payload:
             payload["id"] = str(uuid.uuid4())
-        if "created_at" not in payload:
-            payload["created_at"] = datetime.now(timezone.utc).isoformat()
-        if "updated_at" not in payload:
-            payload["updated_at"] = datetime.now(timezone.utc).isoformat()
+        elif payload["id"] in self._tables[table]:
+            # Same answer PostgREST gives for a primary key violation
+            return MockResponse(
+                409,
+                {
+                    "code": "23505",
+                    "message": "duplicate key value violates unique constraint",
+                },
+            )
+        if "created_at" not in payload or "updated_at" not in payload:
+            now = datetime.now(timezone.utc).isoformat()
+            payload.setdefault("created_at", now)
+            payload.setdefault("updated_at", now)
 
-        self._tables[table].append(payload.copy())
+        self._insert(table, payload.copy())
 
         # Return representation if requested
         if headers and headers.get("Prefer") == "return=representation":
@@ -124,31 +206,31 @@ class MockSupabaseClient:
 
         # Find matching rows
         filters = params or {}
-        rows = self._tables[table]
-        matching_indices = []
+        matching = []
 
         for key, value in filters.items():
             if "." in str(value):
                 op, val = str(value).split(".", 1)
                 if op == "eq":
-                    for i, row in enumerate(rows):
-                        if str(row.get(key)) == val:
-                            matching_indices.append(i)
+                    matching.extend(self._lookup(table, {key: val}))
 
-        if not matching_indices:
+        if not matching:
             return MockResponse(404, {"error": "Not found"})
 
         # Update all matching rows (for batch updates)
+        now = datetime.now(timezone.utc).isoformat()
         updated_rows = []
-        for idx in matching_indices:
+        for row in matching:
             update_data = json or {}
+            self._unindex(table, row)
             # Handle setting deleted_at to None explicitly
             if "deleted_at" in update_data and update_data["deleted_at"] is None:
-                rows[idx]["deleted_at"] = None
+                row["deleted_at"] = None
             else:
-                rows[idx].update(update_data)
-            rows[idx]["updated_at"] = datetime.now(timezone.utc).isoformat()
-            updated_rows.append(rows[idx])
+                row.update(update_data)
+            row["updated_at"] = now
+            self._reindex(table, row)
+            updated_rows.append(row)
 
         if headers and headers.get("Prefer") == "return=representation":
             # Return as list for consistency with Supabase
@@ -171,33 +253,38 @@ class MockSupabaseClient:
             if "." in str(value):
                 op, val = str(value).split(".", 1)
                 if op == "eq":
-                    for i, row in enumerate(rows):
+                    for row in self._lookup(table, {key: val}):
                         if row.get(key) == val:
-                            to_remove.append(i)
+                            to_remove.append(row.get("id"))
 
-        # Remove in reverse order to maintain indices
-        for i in sorted(to_remove, reverse=True):
-            rows.pop(i)
+        for row_id in to_remove:
+            row = rows.pop(row_id, None)
+            if row is not None:
+                self._unindex(table, row)
+                del self._seq[table][row_id]
 
         return MockResponse(204, None)
 
     def clear(self):
         """Clear all tables except users."""
-        default_user = self._tables["users"][0] if self._tables.get("users") else None
+        default_user = next(iter(self._tables["users"].values()), None)
         for table in self._tables:
             self._tables[table].clear()
+            self._seq[table].clear()
+            self._indexes[table].clear()
         # Re-seed default user
         if default_user:
-            self._tables["users"].append(default_user)
+            self._insert("users", default_user)
         else:
             self._seed_default_user()
 
     def seed_workroom(self, user_id: str, tenant_id: str) -> Dict[str, Any]:
         """Seed workroom with test data."""
         # Preserve action_items when seeding workroom (they may have been seeded separately)
-        preserved_action_items = self._tables.get("action_items", [])[:]
+        preserved_action_items = list(self._tables["action_items"].values())
         self.clear()
-        self._tables["action_items"] = preserved_action_items
+        for item in preserved_action_items:
+            self._insert("action_items", item)
 
         # Create projects
         project1 = {
@@ -224,7 +311,8 @@ class MockSupabaseClient:
             "metadata": {},
             "deleted_at": None,
         }
-        self._tables["projects"].extend([project1, project2])
+        self._insert("projects", project1)
+        self._insert("projects", project2)
 
         # Create tasks
         task1 = {
@@ -253,7 +341,8 @@ class MockSupabaseClient:
             "source_ref": {},
             "deleted_at": None,
         }
-        self._tables["tasks"].extend([task1, task2])
+        self._insert("tasks", task1)
+        self._insert("tasks", task2)
 
         return {
             "projects": [project1, project2],
@@ -282,7 +371,7 @@ class MockSupabaseClient:
                 },
             }
             items.append(item)
-            self._tables["action_items"].append(item)
+            self._insert("action_items", item)
         return items
 
 
@@ -3,43 +3,100 @@ from typing import List
 import argparse
 import json
 import os
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
-from llm_testing.harness import run_scenario
+try:
+    import orjson  # type: ignore
+except ImportError:  # pragma: no cover - optional
+    orjson = None
+
+from llm_testing.harness import close_backends, init_worker, prewarm, run_scenario
 from llm_testing.evaluator import evaluate
 
 
-def run(paths: List[str]) -> str:
-    run_id = None
-    for p in paths:
-        res = run_scenario(p)
-        run_id = res["run_id"]
-        graded_path = Path(res["report"]).with_suffix(".graded.json")
-        ev = evaluate(res["report"])
-        with open(graded_path, "w") as f:
-            json.dump({"evaluation": ev}, f, indent=2)
-    return run_id or ""
+def _run_one(p: Path) -> str:
+    """Run and grade one scenario; returns its run id."""
+    res = run_scenario(p)
+    graded_path = Path(res["report"]).with_suffix(".graded.json")
+    ev = evaluate(res["report"])
+    if orjson is not None:
+        buf = orjson.dumps({"evaluation": ev}, option=orjson.OPT_INDENT_2)
+    else:
+        buf = json.dumps({"evaluation": ev}, indent=2).encode()
+    graded_path.write_bytes(buf)
+    return res["run_id"]
+
+
+def run(paths: List[Path], workers: int = 1) -> str:
+    """Run and grade scenarios, sequentially unless ``workers`` > 1.
+
+    Each worker grades its own scenarios, so with LLM_EVAL_API_KEY set
+    ``workers`` is also the number of concurrent grader API requests.
+    Workers get their own app state dir (see harness.init_worker). With a
+    single worker (or path) everything runs in this process. Returns the run
+    id of the last scenario in ``paths``.
+    """
+    prewarm(paths)
+    if workers == 1 or len(paths) <= 1:
+        try:
+            run_ids = [_run_one(p) for p in paths]
+        finally:
+            close_backends()
+    else:
+        with tempfile.TemporaryDirectory(prefix="llm_testing_") as base:
+            with ProcessPoolExecutor(
+                max_workers=workers,
+                initializer=init_worker,
+                initargs=(base,),
+            ) as ex:
+                run_ids = list(ex.map(_run_one, paths))
+    return run_ids[-1] if run_ids else ""
+
+
+def _positive_int(value: str) -> int:
+    try:
+        n = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid int value: {value!r}")
+    if n < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {n}")
+    return n
 
 
 def main() -> None:
     parser = argparse.ArgumentParser()
     parser.add_argument("--all", action="store_true")
-    parser.add_argument("--scenarios", nargs="*")
+    parser.add_argument("--scenarios", nargs="*", type=Path)
     parser.add_argument(
         "--live",
         action="store_true",
         help="Run scenarios against live LLM provider (sets LLM_TESTING_MODE=false)",
     )
+    parser.add_argument(
+        "--workers",
+        type=_positive_int,
+        default=1,
+        help=(
+            "Scenario worker processes (default: 1; always 1 with --live). "
+            "With LLM_EVAL_API_KEY set, each worker sends its own grader "
+            "requests, so this also sets grader API concurrency."
+        ),
+    )
     args = parser.parse_args()
 
+    workers = args.workers
     if args.live:
         os.environ["LLM_TESTING_MODE"] = "false"
+        # Stay sequential against the live provider to respect rate limits
+        workers = 1
 
     if args.all:
-        paths = sorted(str(p) for p in Path("llm_testing/scenarios").glob("*.yaml"))
+        paths = sorted(Path("llm_testing/scenarios").glob("*.yaml"))
     else:
-        paths = args.scenarios
-    run_id = run(paths)
+        paths = args.scenarios or []
+    run_id = run(paths, workers=workers)
     print(run_id)
 
 
@@ -0,0 +1,41 @@
+"""Tests for backend client lifecycle."""
+
+import pytest
+from pathlib import Path
+import sys
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from llm_testing.backends.http import HTTPBackend
+
+
+@pytest.fixture
+def harness(tmp_path, monkeypatch):
+    """Import the harness with app state under tmp_path, not ./.data."""
+    monkeypatch.setenv("DATA_DIR", str(tmp_path / ".data"))
+    from llm_testing import harness
+
+    return harness
+
+
+def test_http_backend_closes_client_on_exit():
+    with HTTPBackend() as backend:
+        assert not backend.client.is_closed
+    assert backend.client.is_closed
+
+
+def test_http_backend_closes_client_on_error():
+    with pytest.raises(RuntimeError):
+        with HTTPBackend() as backend:
+            raise RuntimeError("scenario failed")
+    assert backend.client.is_closed
+
+
+def test_close_backends_closes_and_forgets_cached(harness, monkeypatch):
+    backends = {("a",): HTTPBackend(), ("b",): HTTPBackend()}
+    monkeypatch.setattr(harness, "_BACKENDS", dict(backends))
+
+    harness.close_backends()
+    assert harness._BACKENDS == {}
+    assert all(backend.client.is_closed for backend in backends.values())
@@ -0,0 +1,38 @@
+"""Tests for the contains expectations used by scenario steps."""
+
+import pytest
+from pathlib import Path
+import sys
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+
+PAYLOAD = {"result": {"ok": True, "title": "Café sync"}, "ids": [1, 2]}
+
+
+@pytest.fixture
+def harness(tmp_path, monkeypatch):
+    """Import the harness with app state under tmp_path, not ./.data."""
+    monkeypatch.setenv("DATA_DIR", str(tmp_path / ".data"))
+    from llm_testing import harness
+
+    return harness
+
+
+def test_key_value_patterns_use_json_dumps_spacing(harness):
+    harness._assert_contains(PAYLOAD, ['"ok": true', '"ids": [1, 2]'])
+    with pytest.raises(AssertionError, match="Missing patterns"):
+        harness._assert_contains(PAYLOAD, ['"ok":true'])
+
+
+def test_non_ascii_patterns_match_escaped_text(harness):
+    harness._assert_contains(PAYLOAD, ["Caf\\u00e9 sync"])
+    with pytest.raises(AssertionError, match="Missing patterns"):
+        harness._assert_contains(PAYLOAD, ["Café sync"])
+
+
+def test_extracted_items_match_contains_text(harness):
+    """A filter-extracted item substituted into a pattern matches the payload."""
+    item = {"op": "create_task", "params": {"title": "Café sync"}}
+    harness._assert_contains({"pending": [item]}, [harness._pattern_text(item)])
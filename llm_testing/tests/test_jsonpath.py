@@ -0,0 +1,68 @@
+"""Tests for the JSONPath expectations used by scenario steps."""
+
+import pytest
+from pathlib import Path
+import sys
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+
+PAYLOAD = {
+    "pending": [
+        {"op": "create_task", "params": {"title": "Write copy", "tags": ["a", "b"]}},
+        {"op": "update_task", "params": {"status": "done"}},
+    ],
+    "result": {"ok": True},
+    "count": 2,
+}
+
+
+@pytest.fixture
+def assert_jsonpath(tmp_path, monkeypatch):
+    """Import the harness with app state under tmp_path, not ./.data."""
+    monkeypatch.setenv("DATA_DIR", str(tmp_path / ".data"))
+    from llm_testing.harness import _assert_jsonpath
+
+    return _assert_jsonpath
+
+
+def test_simple_paths(assert_jsonpath):
+    assert_jsonpath(PAYLOAD, "result.ok", True)
+    assert_jsonpath(PAYLOAD, "pending.1.op", "update_task")
+    assert_jsonpath(PAYLOAD, "result.missing", None)
+    assert_jsonpath(PAYLOAD, "pending.5", None)
+    with pytest.raises(AssertionError, match="expected False, got True"):
+        assert_jsonpath(PAYLOAD, "result.ok", False)
+
+
+def test_simple_path_errors_name_the_failing_step(assert_jsonpath):
+    with pytest.raises(ValueError, match=r"^Path not found: count\.value$"):
+        assert_jsonpath(PAYLOAD, "count.value.deep", 1)
+    with pytest.raises(ValueError, match=r"^Invalid JSONPath: pending\.op$"):
+        assert_jsonpath(PAYLOAD, "pending.op", "create_task")
+
+
+def test_filter_paths(assert_jsonpath):
+    assert_jsonpath(PAYLOAD, "pending[?(@.op == 'create_task')].op", "create_task")
+    assert_jsonpath(
+        PAYLOAD, "pending[?(@.op == 'create_task')].params.title", "Write copy"
+    )
+    assert_jsonpath(PAYLOAD, 'pending[?(@.op == "create_task")].params.tags.1', "b")
+    assert_jsonpath(PAYLOAD, "pending[?(@.op == 'update_task')]", True)
+
+
+def test_filter_errors_name_array_path_and_filter(assert_jsonpath):
+    with pytest.raises(
+        ValueError, match=r"^No item in pending matching \[\?\(@\.op == 'delete_task'\)\]$"
+    ):
+        assert_jsonpath(PAYLOAD, "pending[?(@.op == 'delete_task')].op", "x")
+    with pytest.raises(ValueError, match=r"^Path not found: queue$"):
+        assert_jsonpath(PAYLOAD, "queue[?(@.op == 'create_task')]", True)
+    with pytest.raises(ValueError, match=r"^Path result is not an array$"):
+        assert_jsonpath(PAYLOAD, "result[?(@.op == 'create_task')]", True)
+    with pytest.raises(
+        ValueError,
+        match=r"^Path not found: params\.title\.x in item of pending matching ",
+    ):
+        assert_jsonpath(PAYLOAD, "pending[?(@.op == 'create_task')].params.title.x.y", 1)
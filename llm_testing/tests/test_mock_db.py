@@ -0,0 +1,128 @@
+"""Tests for the in-memory Supabase mock."""
+
+import pytest
+from pathlib import Path
+import sys
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from llm_testing.mock_db import MockSupabaseClient
+
+
+@pytest.fixture
+def client():
+    client = MockSupabaseClient()
+    client.clear()
+    return client
+
+
+def _titles(response):
+    return [row["title"] for row in response.json()]
+
+
+def test_rows_keep_insertion_order(client):
+    """get/patch/delete keep the order rows were inserted in."""
+    for title in ("a", "b", "c", "d"):
+        client.post("/tasks", json={"id": title, "title": title, "status": "todo"})
+
+    assert _titles(client.get("/tasks")) == ["a", "b", "c", "d"]
+
+    client.patch("/tasks", params={"id": "eq.b"}, json={"status": "done"})
+    assert _titles(client.get("/tasks")) == ["a", "b", "c", "d"]
+    assert client.get("/tasks", params={"id": "eq.b"}).json()[0]["status"] == "done"
+
+    client.delete("/tasks", params={"id": "eq.c"})
+    assert _titles(client.get("/tasks")) == ["a", "b", "d"]
+
+    client.post("/tasks", json={"id": "c", "title": "c", "status": "todo"})
+    assert _titles(client.get("/tasks")) == ["a", "b", "d", "c"]
+    assert [row["id"] for row in client.rows("tasks")] == ["a", "b", "d", "c"]
+
+
+def test_post_rejects_duplicate_id(client):
+    """Re-inserting an existing id fails instead of replacing the row."""
+    client.post("/tasks", json={"id": "t1", "title": "first"})
+    response = client.post("/tasks", json={"id": "t1", "title": "second"})
+
+    assert response.status_code == 409
+    assert response.json()["code"] == "23505"
+    with pytest.raises(Exception):
+        response.raise_for_status()
+    assert _titles(client.get("/tasks")) == ["first"]
+    assert _titles(client.get("/tasks", params={"title": "eq.second"})) == []
+
+
+def test_insert_rejects_duplicate_id(client):
+    client._insert("tasks", {"id": "t1", "title": "first"})
+    with pytest.raises(ValueError):
+        client._insert("tasks", {"id": "t1", "title": "second"})
+    assert client.rows("tasks") == [{"id": "t1", "title": "first"}]
+
+
+QUERIES = [
+    {"status": "eq.todo"},
+    {"status": "eq.todo", "project_id": "eq.p1"},
+    {"order": "created_at.desc", "status": "eq.todo"},
+    {"limit": "2", "status": "eq.todo"},
+    {"status": "eq.todo", "limit": "2"},
+    {"order": "created_at.desc", "limit": "1", "project_id": "eq.p2"},
+    {"project_id": "eq.p1", "deleted_at": "is.null"},
+]
+
+
+def _unindexed_get(client, params):
+    indexes, client._indexes = client._indexes, {}
+    try:
+        return client.get("/tasks", params=params).json()
+    finally:
+        client._indexes = indexes
+
+
+def _assert_indexes_agree(client):
+    for params in QUERIES:
+        assert client.get("/tasks", params=params).json() == _unindexed_get(
+            client, params
+        ), params
+
+
+def test_indexed_get_matches_scan_across_mutations(client):
+    """Index lookups give the same rows as a full scan after every write."""
+    for i in range(6):
+        client.post(
+            "/tasks",
+            json={
+                "id": f"t{i}",
+                "title": f"t{i}",
+                "status": "todo",
+                "project_id": f"p{i % 2 + 1}",
+                "deleted_at": None,
+            },
+        )
+    _assert_indexes_agree(client)  # builds the indexes
+
+    client.patch("/tasks", params={"id": "eq.t0"}, json={"status": "done"})
+    _assert_indexes_agree(client)
+    client.patch("/tasks", params={"project_id": "eq.p2"}, json={"project_id": "p1"})
+    _assert_indexes_agree(client)
+    client.patch("/tasks", params={"id": "eq.t3"}, json={"deleted_at": None})
+    _assert_indexes_agree(client)
+
+    client.delete("/tasks", params={"id": "eq.t2"})
+    _assert_indexes_agree(client)
+    client.delete("/tasks", params={"status": "eq.done"})
+    _assert_indexes_agree(client)
+
+    client.post("/tasks", json={"id": "t2", "title": "t2", "status": "todo"})
+    _assert_indexes_agree(client)
+    assert [row["id"] for row in client.get("/tasks", params=QUERIES[0]).json()] == [
+        "t1",
+        "t3",
+        "t4",
+        "t5",
+        "t2",
+    ]
+
+    client.clear()
+    _assert_indexes_agree(client)
+    assert client.get("/tasks", params=QUERIES[0]).json() == []
@@ -0,0 +1,32 @@
+"""Tests for the scenario runner CLI."""
+
+import pytest
+from pathlib import Path
+import sys
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+
+@pytest.fixture
+def runner(tmp_path, monkeypatch):
+    """Import the runner with app state under tmp_path, not ./.data."""
+    monkeypatch.setenv("DATA_DIR", str(tmp_path / ".data"))
+    from llm_testing import runner
+
+    return runner
+
+
+@pytest.mark.parametrize("workers", ["0", "-1", "two"])
+def test_workers_must_be_positive(runner, monkeypatch, capsys, workers):
+    monkeypatch.setattr(sys, "argv", ["runner", "--workers", workers])
+    with pytest.raises(SystemExit) as exc:
+        runner.main()
+    assert exc.value.code == 2
+    assert "--workers" in capsys.readouterr().err
+
+
+def test_no_scenarios_runs_nothing(runner, monkeypatch, capsys):
+    monkeypatch.setattr(sys, "argv", ["runner", "--workers", "4"])
+    runner.main()
+    assert capsys.readouterr().out == "\n"
@@ -0,0 +1,55 @@
+"""Tests for the streamed transcript step log."""
+
+import pytest
+import json
+from pathlib import Path
+import sys
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from llm_testing.evaluator import _load_transcript
+
+
+@pytest.fixture
+def step_log_cls(tmp_path, monkeypatch):
+    """Import the harness with app state under tmp_path, not ./.data."""
+    monkeypatch.setenv("DATA_DIR", str(tmp_path / ".data"))
+    from llm_testing.harness import _StepLog
+
+    return _StepLog
+
+
+def test_step_log_closes_on_failed_step(tmp_path, step_log_cls):
+    """A step assertion failing mid-scenario still closes the log."""
+    path = tmp_path / "demo.steps.jsonl"
+    with pytest.raises(AssertionError):
+        with step_log_cls(path) as step_log:
+            step_log.append({"endpoint": "/a", "response": {"ok": True}})
+            raise AssertionError("status mismatch")
+    assert step_log._fp.closed
+    lines = path.read_text().splitlines()
+    assert [json.loads(line) for line in lines] == [
+        {"endpoint": "/a", "response": {"ok": True}}
+    ]
+
+
+def test_load_transcript_reads_steps_file(tmp_path, step_log_cls):
+    """Reports naming a steps file get their steps read back from it."""
+    with step_log_cls(tmp_path / "demo.steps.jsonl") as step_log:
+        step_log.append({"endpoint": "/a"})
+        step_log.append({"endpoint": "/b"})
+    rep = {"transcript": {"scenario": "demo", "steps_file": "demo.steps.jsonl"}}
+
+    transcript = _load_transcript(rep, str(tmp_path / "demo.json"))
+    assert transcript == {
+        "scenario": "demo",
+        "steps": [{"endpoint": "/a"}, {"endpoint": "/b"}],
+    }
+
+
+def test_load_transcript_accepts_embedded_steps(tmp_path):
+    """Reports written before the step log keep working."""
+    rep = {"transcript": {"scenario": "demo", "steps": [{"endpoint": "/a"}]}}
+    transcript = _load_transcript(rep, str(tmp_path / "demo.json"))
+    assert transcript["steps"] == [{"endpoint": "/a"}]
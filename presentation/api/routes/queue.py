@@ -105,7 +105,7 @@ async def get_queue(
         mock_db = get_mock_client()
         
         # Get action items from mock DB
-        action_items = mock_db._tables.get("action_items", [])
+        action_items = mock_db.rows("action_items")
         # Filter by tenant and owner
         user_items = [
             item for item in action_items
@@ -814,7 +814,7 @@ async def seed_workroom(
         tenant_id, resolved_user_id = _resolve_identity(user_id)
         mock_db = get_mock_client()
         # Check if mock DB is actually being used (has seeded user)
-        if mock_db._tables.get("users"):
+        if mock_db.rows("users"):
             seed_data = mock_db.seed_workroom(resolved_user_id, tenant_id)
             # Return in same format as real seeding
             return {